@@ -10,7 +10,7 @@ from sqlalchemy import String
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.database import Base, build_db_url
 
 
@@ -28,7 +28,7 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
 
 
 engine = create_async_engine(
-    build_db_url(**MediaManagerConfig().database.model_dump()), echo=False
+    build_db_url(**get_config().database.model_dump()), echo=False
 )
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
@@ -16,7 +16,7 @@ from media_manager.auth.users import (
     openid_client,
     openid_cookie_auth_backend,
 )
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.database import DbSessionDependency
 
 
@@ -59,7 +59,7 @@ def get_openid_router() -> APIRouter:
     )
 
 
-openid_config = MediaManagerConfig().auth.openid_connect
+openid_config = get_config().auth.openid_connect
 
 
 @users_router.get(
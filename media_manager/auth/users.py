@@ -21,11 +21,11 @@ from starlette import status
 import media_manager.notification.utils
 from media_manager.auth.db import User, get_async_session, get_user_db
 from media_manager.auth.schemas import UserCreate, UserUpdate
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 
 log = logging.getLogger(__name__)
 
-config = MediaManagerConfig().auth
+config = get_config().auth
 SECRET = config.token_secret
 LIFETIME = config.session_lifetime
 
@@ -72,7 +72,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     async def on_after_forgot_password(
         self, user: User, token: str, request: Request | None = None
     ) -> None:
-        link = f"{MediaManagerConfig().misc.frontend_url}web/login/reset-password?token={token}"
+        link = f"{get_config().misc.frontend_url}web/login/reset-password?token={token}"
         log.info(f"User {user.id} has forgot their password. Reset Link: {link}")
 
         if not config.email_password_resets:
@@ -139,7 +139,7 @@ async def create_default_admin_user() -> None:
                     stmt = select(func.count(User.id))
                     result = await session.execute(stmt)
                     user_count = result.scalar()
-                    config = MediaManagerConfig()
+                    config = get_config()
                     if user_count == 0:
                         log.info(
                             "No users found in database. Creating default admin user..."
@@ -191,7 +191,7 @@ def get_jwt_strategy() -> JWTStrategy[models.UP, models.ID]:
 class RedirectingCookieTransport(CookieTransport):
     async def get_login_response(self, token: str) -> Response:
         response = RedirectResponse(
-            str(MediaManagerConfig().misc.frontend_url) + "web/dashboard",
+            str(get_config().misc.frontend_url) + "web/dashboard",
             status_code=status.HTTP_302_FOUND,
         )
         return self._set_login_cookie(response, token)
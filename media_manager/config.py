@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import cache
 from pathlib import Path
 
 from pydantic import AnyHttpUrl
@@ -83,3 +84,13 @@ class MediaManagerConfig(BaseSettings):
             TomlConfigSettingsSource(settings_cls),
             file_secret_settings,
         )
+
+
+@cache
+def get_config() -> MediaManagerConfig:
+    """
+    Returns the process-wide MediaManagerConfig, so the environment and the config
+    file are parsed once instead of on every call. Call get_config.cache_clear()
+    to load them again.
+    """
+    return MediaManagerConfig()
@@ -71,6 +71,9 @@ def init_engine(
         max_overflow=10,
         pool_timeout=30,
         pool_recycle=1800,
+        # the default of 500 compiled statements is too small to hold every
+        # repository query, evicted statements have to be compiled again
+        query_cache_size=1200,
     )
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     log.debug("SQLAlchemy engine initialized")
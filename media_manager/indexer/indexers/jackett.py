@@ -7,7 +7,7 @@ from dataclasses import dataclass
 
 import requests
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.indexer.indexers.generic import GenericIndexer
 from media_manager.indexer.indexers.torznab_mixin import TorznabMixin
 from media_manager.indexer.schemas import IndexerQueryResult
@@ -39,7 +39,7 @@ class Jackett(GenericIndexer, TorznabMixin):
 
         """
         super().__init__(name="jackett")
-        config = MediaManagerConfig().indexers.jackett
+        config = get_config().indexers.jackett
         self.api_key = config.api_key
         self.url = config.url
         self.indexers = config.indexers
@@ -1,6 +1,6 @@
 import logging
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.indexer.indexers.generic import GenericIndexer
 from media_manager.indexer.indexers.jackett import Jackett
 from media_manager.indexer.indexers.prowlarr import Prowlarr
@@ -15,7 +15,7 @@ log = logging.getLogger(__name__)
 
 class IndexerService:
     def __init__(self, indexer_repository: IndexerRepository) -> None:
-        config = MediaManagerConfig()
+        config = get_config()
         self.repository = indexer_repository
         self.indexers: list[GenericIndexer] = []
 
@@ -4,7 +4,7 @@ from urllib.parse import urljoin
 
 import requests
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.indexer.config import ScoringRuleSet
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.movies.schemas import Movie
@@ -16,8 +16,8 @@ log = logging.getLogger(__name__)
 def evaluate_indexer_query_result(
     query_result: IndexerQueryResult, ruleset: ScoringRuleSet
 ) -> tuple[IndexerQueryResult, bool]:
-    title_rules = MediaManagerConfig().indexers.title_scoring_rules
-    indexer_flag_rules = MediaManagerConfig().indexers.indexer_flag_scoring_rules
+    title_rules = get_config().indexers.title_scoring_rules
+    indexer_flag_rules = get_config().indexers.indexer_flag_scoring_rules
     for rule_name in ruleset.rule_names:
         for rule in title_rules:
             if rule.name == rule_name:
@@ -88,9 +88,7 @@ def evaluate_indexer_query_result(
 def evaluate_indexer_query_results(
     query_results: list[IndexerQueryResult], media: Show | Movie, is_tv: bool
 ) -> list[IndexerQueryResult]:
-    scoring_rulesets: list[ScoringRuleSet] = (
-        MediaManagerConfig().indexers.scoring_rule_sets
-    )
+    scoring_rulesets: list[ScoringRuleSet] = get_config().indexers.scoring_rule_sets
     for ruleset in scoring_rulesets:
         if (
             (media.library in ruleset.libraries)
@@ -32,7 +32,7 @@ from media_manager.auth.users import (
     cookie_auth_backend,
     fastapi_users,
 )
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.database import init_engine
 from media_manager.exceptions import (
     ConflictError,
@@ -49,17 +49,14 @@ from media_manager.filesystem_checks import run_filesystem_checks
 from media_manager.logging import LOGGING_CONFIG, setup_logging
 from media_manager.notification.router import router as notification_router
 from media_manager.scheduler import (
+    STARTUP_TASKS,
     broker,
     build_scheduler_loop,
-    import_all_movie_torrents_task,
-    import_all_show_torrents_task,
-    update_all_movies_metadata_task,
-    update_all_non_ended_shows_metadata_task,
 )
 
 setup_logging()
 
-config = MediaManagerConfig()
+config = get_config()
 log = logging.getLogger(__name__)
 
 
@@ -98,12 +95,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         receiver_task = asyncio.create_task(receiver.listen(finish_event))
         loop_task = asyncio.create_task(scheduler_loop.run(skip_first_run=True))
         try:
-            await asyncio.gather(
-                import_all_movie_torrents_task.kiq(),
-                import_all_show_torrents_task.kiq(),
-                update_all_movies_metadata_task.kiq(),
-                update_all_non_ended_shows_metadata_task.kiq(),
-            )
+            await asyncio.gather(*(task.kiq() for task in STARTUP_TASKS))
         except Exception:
             log.exception("Failed to submit initial background tasks during startup.")
             raise
@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.metadataProvider.schemas import MetaDataProviderSearchResult
 from media_manager.movies.schemas import Movie
 from media_manager.tv.schemas import Show
@@ -10,7 +10,7 @@ log = logging.getLogger(__name__)
 
 
 class AbstractMetadataProvider(ABC):
-    storage_path = MediaManagerConfig().misc.image_directory
+    storage_path = get_config().misc.image_directory
 
     @property
     @abstractmethod
@@ -4,7 +4,7 @@ from typing import override
 import requests
 
 import media_manager.metadataProvider.utils
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.metadataProvider.abstract_metadata_provider import (
     AbstractMetadataProvider,
 )
@@ -22,7 +22,7 @@ class TmdbMetadataProvider(AbstractMetadataProvider):
     name = "tmdb"
 
     def __init__(self) -> None:
-        config = MediaManagerConfig().metadata.tmdb
+        config = get_config().metadata.tmdb
         self.url = config.tmdb_relay_url
         self.primary_languages = config.primary_languages
         self.default_language = config.default_language
@@ -4,7 +4,7 @@ from typing import override
 import requests
 
 import media_manager.metadataProvider.utils
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.metadataProvider.abstract_metadata_provider import (
     AbstractMetadataProvider,
 )
@@ -19,7 +19,7 @@ class TvdbMetadataProvider(AbstractMetadataProvider):
     name = "tvdb"
 
     def __init__(self) -> None:
-        config = MediaManagerConfig().metadata.tvdb
+        config = get_config().metadata.tvdb
         self.url = config.tvdb_relay_url
 
     def __get_show(self, show_id: int) -> dict:
@@ -33,7 +33,7 @@ class MovieFile(Base):
 
     quality: Mapped[Quality]
     torrent_id: Mapped[UUID | None] = mapped_column(
-        ForeignKey(column="torrent.id", ondelete="SET NULL"),
+        ForeignKey(column="torrent.id", ondelete="SET NULL"), index=True
     )
 
     torrent = relationship("Torrent", back_populates="movie_files", uselist=False)
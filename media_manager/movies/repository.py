@@ -127,10 +127,9 @@ class MovieRepository:
             self.db.add(db_movie)
 
         try:
+            self.db.flush()
+            saved_movie = MovieSchema.model_validate(db_movie)
             self.db.commit()
-            self.db.refresh(db_movie)
-            log.info(f"Successfully saved movie: {db_movie.name} (ID: {db_movie.id})")
-            return MovieSchema.model_validate(db_movie)
         except IntegrityError as e:
             self.db.rollback()
             log.exception(f"Integrity error while saving movie {movie.name}")
@@ -142,6 +141,11 @@ class MovieRepository:
             self.db.rollback()
             log.exception(f"Database error while saving movie {movie.name}")
             raise
+        else:
+            log.info(
+                f"Successfully saved movie: {saved_movie.name} (ID: {saved_movie.id})"
+            )
+            return saved_movie
 
     def delete_movie(self, movie_id: MovieId) -> None:
         """
@@ -200,8 +204,6 @@ class MovieRepository:
         try:
             self.db.add(db_model)
             self.db.commit()
-            self.db.refresh(db_model)
-            return MovieFileSchema.model_validate(db_model)
         except IntegrityError:
             self.db.rollback()
             log.exception("Integrity error while adding movie file")
@@ -210,6 +212,8 @@ class MovieRepository:
             self.db.rollback()
             log.exception("Database error while adding movie file")
             raise
+        else:
+            return movie_file
 
     def remove_movie_files_by_torrent_id(self, torrent_id: TorrentId) -> int:
         """
@@ -367,7 +371,7 @@ class MovieRepository:
             db_movie.imdb_id = imdb_id
             updated = True
 
+        updated_movie = MovieSchema.model_validate(db_movie)
         if updated:
             self.db.commit()
-            self.db.refresh(db_movie)
-        return MovieSchema.model_validate(db_movie)
+        return updated_movie
@@ -3,7 +3,7 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from media_manager.auth.users import current_active_user, current_superuser
-from media_manager.config import LibraryItem, MediaManagerConfig
+from media_manager.config import LibraryItem, get_config
 from media_manager.exceptions import ConflictError, NotFoundError
 from media_manager.indexer.schemas import (
     IndexerQueryResult,
@@ -95,7 +95,7 @@ def import_detected_movie(
     """
     source_directory = Path(directory)
     if source_directory not in get_importable_media_directories(
-        MediaManagerConfig().misc.movie_directory
+        get_config().misc.movie_directory
     ):
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "No such directory")
     success = movie_service.import_existing_movie(
@@ -177,7 +177,7 @@ def get_available_libraries() -> list[LibraryItem]:
     """
     Get available Movie libraries from configuration.
     """
-    return MediaManagerConfig().misc.movie_libraries
+    return get_config().misc.movie_libraries
 
 
 # -----------------------------------------------------------------------------
@@ -5,7 +5,7 @@ from typing import overload
 
 from sqlalchemy.exc import IntegrityError
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.exceptions import InvalidConfigError, NotFoundError, RenameError
 from media_manager.indexer.schemas import IndexerQueryResult, IndexerQueryResultId
 from media_manager.indexer.service import IndexerService
@@ -417,7 +417,7 @@ class MovieService:
         return movie_torrent
 
     def get_movie_root_path(self, movie: Movie) -> Path:
-        misc_config = MediaManagerConfig().misc
+        misc_config = get_config().misc
         movie_file_path = (
             misc_config.movie_directory
             / f"{remove_special_characters(movie.name)} ({movie.year}) [{movie.metadata_provider}id-{movie.external_id}]"
@@ -633,7 +633,7 @@ class MovieService:
     def get_importable_movies(
         self, metadata_provider: AbstractMetadataProvider
     ) -> list[MediaImportSuggestion]:
-        movie_root_path = MediaManagerConfig().misc.movie_directory
+        movie_root_path = get_config().misc.movie_directory
         importable_movies: list[MediaImportSuggestion] = []
         candidate_dirs = get_importable_media_directories(movie_root_path)
 
@@ -663,18 +663,21 @@ class MovieService:
 
     def import_all_torrents(self) -> None:
         log.info("Importing all torrents")
-        torrents = self.torrent_service.get_all_torrents()
+        torrents = self.torrent_service.get_unimported_torrents()
         log.info("Found %d torrents to import", len(torrents))
-        for t in torrents:
+        finished_torrents = [
+            t for t in torrents if not t.imported and t.status == TorrentStatus.finished
+        ]
+        movies = self.torrent_service.get_movies_of_torrents(torrents=finished_torrents)
+        for t in finished_torrents:
+            movie = movies.get(t.id)
+            if movie is None:
+                log.warning(
+                    f"torrent {t.title} is not a movie torrent, skipping import."
+                )
+                continue
             try:
-                if not t.imported and t.status == TorrentStatus.finished:
-                    movie = self.torrent_service.get_movie_of_torrent(torrent=t)
-                    if movie is None:
-                        log.warning(
-                            f"torrent {t.title} is not a movie torrent, skipping import."
-                        )
-                        continue
-                    self.import_torrent_files(torrent=t, movie=movie)
+                self.import_torrent_files(torrent=t, movie=movie)
             except RuntimeError:
                 log.exception(f"Failed to import torrent {t.title}")
         log.info("Finished importing all torrents")
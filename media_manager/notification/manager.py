@@ -4,7 +4,7 @@ Notification Manager - Orchestrates sending notifications through all configured
 
 import logging
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstract_notification_service_provider import (
     AbstractNotificationServiceProvider,
@@ -31,7 +31,7 @@ class NotificationManager:
     """
 
     def __init__(self) -> None:
-        self.config = MediaManagerConfig().notifications
+        self.config = get_config().notifications
         self.providers: list[AbstractNotificationServiceProvider] = []
         self._initialize_providers()
 
@@ -1,6 +1,7 @@
 import logging
 
-from sqlalchemy import delete, select, update
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.exc import (
     IntegrityError,
     SQLAlchemyError,
@@ -19,6 +20,14 @@ from media_manager.notification.schemas import (
 
 log = logging.getLogger(__name__)
 
+# rows are streamed from a server-side cursor in batches of this size, so the
+# full ORM result set is never held in memory next to the validated schemas
+NOTIFICATION_FETCH_BATCH_SIZE = 500
+
+# validates a whole result set in a single call into pydantic-core; it is fed
+# a generator so rows are still consumed batch by batch from the cursor
+NOTIFICATION_LIST_ADAPTER = TypeAdapter(list[NotificationSchema])
+
 
 class NotificationRepository:
     def __init__(self, db: Session) -> None:
@@ -31,7 +40,13 @@ class NotificationRepository:
             msg = f"Notification with id {nid} not found."
             raise NotFoundError(msg)
 
-        return NotificationSchema.model_validate(result)
+        # the row is already typed by the ORM, no need to run the validators
+        return NotificationSchema.model_construct(
+            id=result.id,
+            read=result.read,
+            message=result.message,
+            timestamp=result.timestamp,
+        )
 
     def get_unread_notifications(self) -> list[NotificationSchema]:
         try:
@@ -39,32 +54,37 @@ class NotificationRepository:
                 select(Notification)
                 .where(Notification.read == false())
                 .order_by(Notification.timestamp.desc())
+                .execution_options(yield_per=NOTIFICATION_FETCH_BATCH_SIZE)
+            )
+            results = self.db.execute(stmt).scalars()
+            return NOTIFICATION_LIST_ADAPTER.validate_python(
+                notification for notification in results
             )
-            results = self.db.execute(stmt).scalars().all()
-            return [
-                NotificationSchema.model_validate(notification)
-                for notification in results
-            ]
         except SQLAlchemyError:
             log.exception("Database error while retrieving unread notifications")
             raise
 
     def get_all_notifications(self) -> list[NotificationSchema]:
         try:
-            stmt = select(Notification).order_by(Notification.timestamp.desc())
-            results = self.db.execute(stmt).scalars().all()
-            return [
-                NotificationSchema.model_validate(notification)
-                for notification in results
-            ]
+            stmt = (
+                select(Notification)
+                .order_by(Notification.timestamp.desc())
+                .execution_options(yield_per=NOTIFICATION_FETCH_BATCH_SIZE)
+            )
+            results = self.db.execute(stmt).scalars()
+            return NOTIFICATION_LIST_ADAPTER.validate_python(
+                notification for notification in results
+            )
         except SQLAlchemyError:
             log.exception("Database error while retrieving notifications")
             raise
 
     def save_notification(self, notification: NotificationSchema) -> None:
         try:
-            self.db.add(
-                Notification(
+            # id and timestamp are generated by the schema, so a plain Core
+            # INSERT is a single round trip and skips the ORM identity map
+            self.db.execute(
+                insert(Notification).values(
                     id=notification.id,
                     read=notification.read,
                     timestamp=notification.timestamp,
@@ -1,30 +1,34 @@
 import media_manager.notification.utils
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstract_notification_service_provider import (
     AbstractNotificationServiceProvider,
 )
 
+EMAIL_SUBJECT_PREFIX = "MediaManager - "
+EMAIL_HTML_TEMPLATE = """\
+<html>
+  <body>
+    <br>
+    {message}
+    <br>
+    <br>
+    This is an automated message from MediaManager.</p>
+  </body>
+</html>
+"""
+
 
 class EmailNotificationServiceProvider(AbstractNotificationServiceProvider):
     def __init__(self) -> None:
-        self.config = MediaManagerConfig().notifications.email_notifications
+        self.config = get_config().notifications.email_notifications
+        self.emails: tuple[str, ...] = tuple(self.config.emails)
 
     def send_notification(self, message: MessageNotification) -> bool:
-        subject = "MediaManager - " + message.title
-        html = f"""\
-                <html>
-                  <body>
-                    <br>
-                    {message.message}
-                    <br>
-                    <br>
-                    This is an automated message from MediaManager.</p>
-                  </body>
-                </html>
-                """
+        subject = EMAIL_SUBJECT_PREFIX + message.title
+        html = EMAIL_HTML_TEMPLATE.format(message=message.message)
 
-        for email in self.config.emails:
+        for email in self.emails:
             media_manager.notification.utils.send_email(
                 subject=subject, html=html, addressee=email
             )
@@ -1,10 +1,12 @@
-import requests
-
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstract_notification_service_provider import (
     AbstractNotificationServiceProvider,
 )
+from media_manager.notification.utils import (
+    NOTIFICATION_REQUEST_TIMEOUT,
+    build_notification_session,
+)
 
 
 class GotifyNotificationServiceProvider(AbstractNotificationServiceProvider):
@@ -13,17 +15,19 @@ class GotifyNotificationServiceProvider(AbstractNotificationServiceProvider):
     """
 
     def __init__(self) -> None:
-        self.config = MediaManagerConfig().notifications.gotify
+        self.config = get_config().notifications.gotify
+        self.session = build_notification_session()
+        self.message_url = f"{self.config.url}/message?token={self.config.api_key}"
 
     def send_notification(self, message: MessageNotification) -> bool:
-        response = requests.post(
-            url=f"{self.config.url}/message?token={self.config.api_key}",
+        response = self.session.post(
+            url=self.message_url,
             json={
                 "message": message.message,
                 "title": message.title,
             },
-            timeout=60,
+            timeout=NOTIFICATION_REQUEST_TIMEOUT,
         )
-        if response.status_code not in range(200, 300):
+        if not 200 <= response.status_code < 300:
             return False
         return True
@@ -1,10 +1,14 @@
-import requests
-
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstract_notification_service_provider import (
     AbstractNotificationServiceProvider,
 )
+from media_manager.notification.utils import (
+    NOTIFICATION_REQUEST_TIMEOUT,
+    build_notification_session,
+)
+
+NTFY_TITLE_PREFIX = "MediaManager - "
 
 
 class NtfyNotificationServiceProvider(AbstractNotificationServiceProvider):
@@ -13,17 +17,18 @@ class NtfyNotificationServiceProvider(AbstractNotificationServiceProvider):
     """
 
     def __init__(self) -> None:
-        self.config = MediaManagerConfig().notifications.ntfy
+        self.config = get_config().notifications.ntfy
+        self.session = build_notification_session()
 
     def send_notification(self, message: MessageNotification) -> bool:
-        response = requests.post(
+        response = self.session.post(
             url=self.config.url,
             data=message.message.encode(encoding="utf-8"),
             headers={
-                "Title": "MediaManager - " + message.title,
+                "Title": NTFY_TITLE_PREFIX + message.title,
             },
-            timeout=60,
+            timeout=NOTIFICATION_REQUEST_TIMEOUT,
         )
-        if response.status_code not in range(200, 300):
+        if not 200 <= response.status_code < 300:
             return False
         return True
@@ -1,6 +1,6 @@
 import requests
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.notification.schemas import MessageNotification
 from media_manager.notification.service_providers.abstract_notification_service_provider import (
     AbstractNotificationServiceProvider,
@@ -9,7 +9,7 @@ from media_manager.notification.service_providers.abstract_notification_service_
 
 class PushoverNotificationServiceProvider(AbstractNotificationServiceProvider):
     def __init__(self) -> None:
-        self.config = MediaManagerConfig().notifications.pushover
+        self.config = get_config().notifications.pushover
 
     def send_notification(self, message: MessageNotification) -> bool:
         response = requests.post(
@@ -22,6 +22,6 @@ class PushoverNotificationServiceProvider(AbstractNotificationServiceProvider):
             },
             timeout=60,
         )
-        if response.status_code not in range(200, 300):
+        if not 200 <= response.status_code < 300:
             return False
         return True
@@ -3,13 +3,20 @@ import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
-from media_manager.config import MediaManagerConfig
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from media_manager.config import get_config
 
 log = logging.getLogger(__name__)
 
+# (connect, read) timeout for requests to notification services
+NOTIFICATION_REQUEST_TIMEOUT = (3, 10)
+
 
 def send_email(subject: str, html: str, addressee: str) -> None:
-    email_conf = MediaManagerConfig().notifications.smtp_config
+    email_conf = get_config().notifications.smtp_config
     message = MIMEMultipart()
     message["From"] = email_conf.from_email
     message["To"] = addressee
@@ -23,3 +30,27 @@ def send_email(subject: str, html: str, addressee: str) -> None:
         server.sendmail(email_conf.from_email, addressee, message.as_string())
 
     log.info(f"Successfully sent email to {addressee} with subject: {subject}")
+
+
+def build_notification_session() -> requests.Session:
+    """
+    Builds a session that retries requests to a notification service with
+    backoff when it is temporarily unavailable.
+
+    :return: The configured session.
+    """
+    retry = Retry(
+        total=3,
+        # the notification may already have been delivered when reading the
+        # response fails, retrying it would send it again
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
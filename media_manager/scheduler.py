@@ -1,23 +1,26 @@
 import asyncio
 import logging
+from collections.abc import Callable
+from functools import cache
+from typing import Any
 from urllib.parse import quote
 
 import taskiq_fastapi
-from taskiq import TaskiqDepends, TaskiqScheduler
+from taskiq import AsyncTaskiqDecoratedTask, TaskiqDepends, TaskiqScheduler
 from taskiq.cli.scheduler.run import SchedulerLoop
 from taskiq_postgresql import PostgresqlBroker
 from taskiq_postgresql.scheduler_source import PostgresqlSchedulerSource
 
+from media_manager.config import get_config
 from media_manager.movies.dependencies import get_movie_service
 from media_manager.movies.service import MovieService
 from media_manager.tv.dependencies import get_tv_service
 from media_manager.tv.service import TvService
 
 
+@cache
 def _build_db_connection_string_for_taskiq() -> str:
-    from media_manager.config import MediaManagerConfig
-
-    db_config = MediaManagerConfig().database
+    db_config = get_config().database
     user = quote(db_config.user, safe="")
     password = quote(db_config.password, safe="")
     dbname = quote(db_config.dbname, safe="")
@@ -39,44 +42,84 @@ taskiq_fastapi.init(broker, "media_manager.main:app")
 log = logging.getLogger(__name__)
 
 
-@broker.task
-async def import_all_movie_torrents_task(
-    movie_service: MovieService = TaskiqDepends(get_movie_service),
-) -> None:
-    log.info("Importing all Movie torrents")
-    await asyncio.to_thread(movie_service.import_all_torrents)
-
-
-@broker.task
-async def import_all_show_torrents_task(
-    tv_service: TvService = TaskiqDepends(get_tv_service),
-) -> None:
-    log.info("Importing all Show torrents")
-    await asyncio.to_thread(tv_service.import_all_torrents)
-
-
-@broker.task
-async def update_all_movies_metadata_task(
-    movie_service: MovieService = TaskiqDepends(get_movie_service),
-) -> None:
-    await asyncio.to_thread(movie_service.update_all_metadata)
-
-
-@broker.task
-async def update_all_non_ended_shows_metadata_task(
-    tv_service: TvService = TaskiqDepends(get_tv_service),
-) -> None:
-    await asyncio.to_thread(tv_service.update_all_non_ended_shows_metadata)
+def _register_service_task(
+    name: str,
+    get_service: Callable[..., MovieService | TvService],
+    job: Callable[[Any], None],
+    cron: str,
+    log_message: str | None = None,
+) -> AsyncTaskiqDecoratedTask:
+    """
+    Register a broker task that resolves a service via its dependency and runs
+    one of its blocking methods in a worker thread.
+
+    :param name: The task name, also used as the key of its schedule.
+    :param get_service: The dependency that provides the service.
+    :param job: The unbound service method to run.
+    :param cron: The cron schedule of the task.
+    :param log_message: Optional message logged before the job runs.
+    :return: The registered task.
+    """
+
+    # only one run per task at a time; a run that fires while the previous one
+    # is still going is skipped instead of piling up behind it
+    running = asyncio.Lock()
+
+    async def task(
+        service: MovieService | TvService = TaskiqDepends(get_service),
+    ) -> None:
+        if running.locked():
+            log.warning(f"Previous run of {name} is still in progress, skipping")
+            return
+        async with running:
+            if log_message:
+                log.info(log_message)
+            await asyncio.to_thread(job, service)
+
+    task.__name__ = name
+    registered_task = broker.task(task_name=f"{__name__}:{name}")(task)
+    _STARTUP_SCHEDULES[registered_task.task_name] = [{"cron": cron}]
+    return registered_task
 
 
 # Maps each task to its cron schedule so PostgresqlSchedulerSource can seed
 # the taskiq_schedulers table on first startup.
-_STARTUP_SCHEDULES: dict[str, list[dict[str, str]]] = {
-    import_all_movie_torrents_task.task_name: [{"cron": "*/2 * * * *"}],
-    import_all_show_torrents_task.task_name: [{"cron": "*/2 * * * *"}],
-    update_all_movies_metadata_task.task_name: [{"cron": "0 0 * * 1"}],
-    update_all_non_ended_shows_metadata_task.task_name: [{"cron": "0 0 * * 1"}],
-}
+_STARTUP_SCHEDULES: dict[str, list[dict[str, str]]] = {}
+
+import_all_movie_torrents_task = _register_service_task(
+    name="import_all_movie_torrents_task",
+    get_service=get_movie_service,
+    job=MovieService.import_all_torrents,
+    cron="*/2 * * * *",
+    log_message="Importing all Movie torrents",
+)
+import_all_show_torrents_task = _register_service_task(
+    name="import_all_show_torrents_task",
+    get_service=get_tv_service,
+    job=TvService.import_all_torrents,
+    cron="*/2 * * * *",
+    log_message="Importing all Show torrents",
+)
+update_all_movies_metadata_task = _register_service_task(
+    name="update_all_movies_metadata_task",
+    get_service=get_movie_service,
+    job=MovieService.update_all_metadata,
+    cron="0 0 * * 1",
+)
+update_all_non_ended_shows_metadata_task = _register_service_task(
+    name="update_all_non_ended_shows_metadata_task",
+    get_service=get_tv_service,
+    job=TvService.update_all_non_ended_shows_metadata,
+    cron="0 0 * * 1",
+)
+
+# Tasks that are additionally kicked off once when the application starts.
+STARTUP_TASKS: tuple[AsyncTaskiqDecoratedTask, ...] = (
+    import_all_movie_torrents_task,
+    import_all_show_torrents_task,
+    update_all_movies_metadata_task,
+    update_all_non_ended_shows_metadata_task,
+)
 
 
 def build_scheduler_loop() -> SchedulerLoop:
@@ -42,6 +42,16 @@ class AbstractDownloadClient(ABC):
         :return: The status of the torrent.
         """
 
+    def get_torrent_statuses(self, torrents: list[Torrent]) -> dict[str, TorrentStatus]:
+        """
+        Get the status of multiple torrents.
+        Clients that can fetch the state of several torrents in one request should override this.
+
+        :param torrents: The torrents to get the status of.
+        :return: A mapping of torrent hash to the status of the torrent.
+        """
+        return {torrent.hash: self.get_torrent_status(torrent) for torrent in torrents}
+
     @abstractmethod
     def pause_torrent(self, torrent: Torrent) -> None:
         """
@@ -1,13 +1,15 @@
 import logging
+from types import MappingProxyType
 
 import qbittorrentapi
 from qbittorrentapi import Conflict409Error
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.torrent.download_clients.abstract_download_client import (
     AbstractDownloadClient,
 )
+from media_manager.torrent.download_clients.state_cache import TorrentStateCache
 from media_manager.torrent.schemas import Torrent, TorrentStatus
 from media_manager.torrent.utils import get_torrent_hash
 
@@ -17,40 +19,65 @@ log = logging.getLogger(__name__)
 class QbittorrentDownloadClient(AbstractDownloadClient):
     name = "qbittorrent"
 
-    DOWNLOADING_STATE = (
-        "allocating",
-        "downloading",
-        "metaDL",
-        "pausedDL",
-        "queuedDL",
-        "stalledDL",
-        "checkingDL",
-        "forcedDL",
-        "moving",
-        "stoppedDL",
-        "forcedMetaDL",
-        "metaDL",
+    DOWNLOADING_STATE = frozenset(
+        {
+            "allocating",
+            "downloading",
+            "metaDL",
+            "pausedDL",
+            "queuedDL",
+            "stalledDL",
+            "checkingDL",
+            "forcedDL",
+            "moving",
+            "stoppedDL",
+            "forcedMetaDL",
+        }
     )
-    FINISHED_STATE = (
-        "uploading",
-        "pausedUP",
-        "queuedUP",
-        "stalledUP",
-        "checkingUP",
-        "forcedUP",
-        "stoppedUP",
+    FINISHED_STATE = frozenset(
+        {
+            "uploading",
+            "pausedUP",
+            "queuedUP",
+            "stalledUP",
+            "checkingUP",
+            "forcedUP",
+            "stoppedUP",
+        }
     )
-    ERROR_STATE = ("missingFiles", "error", "checkingResumeData")
-    UNKNOWN_STATE = ("unknown",)
+    ERROR_STATE = frozenset({"missingFiles", "error", "checkingResumeData"})
+    UNKNOWN_STATE = frozenset({"unknown"})
+
+    # qBittorrent state to TorrentStatus, states not listed here are treated as errors
+    STATE_MAPPING = MappingProxyType(
+        {
+            **dict.fromkeys(DOWNLOADING_STATE, TorrentStatus.downloading),
+            **dict.fromkeys(FINISHED_STATE, TorrentStatus.finished),
+            **dict.fromkeys(ERROR_STATE, TorrentStatus.error),
+            **dict.fromkeys(UNKNOWN_STATE, TorrentStatus.unknown),
+        }
+    )
+
+    # states fetched from qBittorrent are reused as they are for STATE_FRESH_SECONDS,
+    # and up to STATE_STALE_SECONDS while they are refreshed in the background
+    STATE_FRESH_SECONDS = 0.5
+    STATE_STALE_SECONDS = 5
 
     def __init__(self) -> None:
-        self.config = MediaManagerConfig().torrents.qbittorrent
+        self.config = get_config().torrents.qbittorrent
+        self._state_cache: TorrentStateCache[str] = TorrentStateCache(
+            fetch=self._fetch_states,
+            fresh_seconds=self.STATE_FRESH_SECONDS,
+            stale_seconds=self.STATE_STALE_SECONDS,
+        )
         self.api_client = qbittorrentapi.Client(
             host=self.config.host,
             port=self.config.port,
             password=self.config.password,
             username=self.config.username,
         )
+        # the session cookie is kept by the client and reused for all further
+        # calls, qbittorrent-api logs in again by itself if it expires
         try:
             self.api_client.auth_log_in()
         except Exception:
@@ -58,17 +85,20 @@ class QbittorrentDownloadClient(AbstractDownloadClient):
             raise
 
         categories = self.api_client.torrents_categories()
-        log.debug(f"Found following categories in qBittorrent: {categories}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Found following categories in qBittorrent: %s", categories)
         if self.config.category_name in categories:
             category = categories.get(self.config.category_name)
             if category.get("savePath") == self.config.category_save_path:
                 log.debug(
-                    f"Category '{self.config.category_name}' already exists in qBittorrent with the correct save path."
+                    "Category '%s' already exists in qBittorrent with the correct save path.",
+                    self.config.category_name,
                 )
                 return
             # category exists but with a different save path, attempt to update it
             log.debug(
-                f"Category '{self.config.category_name}' already exists in qBittorrent but with a different save path. Attempting to update it."
+                "Category '%s' already exists in qBittorrent but with a different save path. Attempting to update it.",
+                self.config.category_name,
             )
             try:
                 self.api_client.torrents_edit_category(
@@ -77,15 +107,17 @@ class QbittorrentDownloadClient(AbstractDownloadClient):
                 )
             except Conflict409Error:
                 log.exception(
-                    f"Attempt to update category '{self.config.category_name}' in qBittorrent with a different save"
-                    f" path failed. The configured save path and the save path saved in Qbittorrent differ,"
-                    f" manually update it in the qBittorrent WebUI or change the save path in the MediaManager"
-                    f" config to match the one in qBittorrent."
+                    "Attempt to update category '%s' in qBittorrent with a different save"
+                    " path failed. The configured save path and the save path saved in Qbittorrent differ,"
+                    " manually update it in the qBittorrent WebUI or change the save path in the MediaManager"
+                    " config to match the one in qBittorrent.",
+                    self.config.category_name,
                 )
         else:
             # create category if it doesn't exist
             log.debug(
-                f"Category '{self.config.category_name}' does not exist in qBittorrent. Attempting to create it."
+                "Category '%s' does not exist in qBittorrent. Attempting to create it.",
+                self.config.category_name,
             )
             try:
                 self.api_client.torrents_create_category(
@@ -94,7 +126,8 @@ class QbittorrentDownloadClient(AbstractDownloadClient):
                 )
             except Conflict409Error:
                 log.exception(
-                    f"Attempt to create category '{self.config.category_name}' in qBittorrent failed. The category already exists but was not found in the initial category list, manually check if the category exists in the qBittorrent WebUI or change the category name in the MediaManager config."
+                    "Attempt to create category '%s' in qBittorrent failed. The category already exists but was not found in the initial category list, manually check if the category exists in the qBittorrent WebUI or change the category name in the MediaManager config.",
+                    self.config.category_name,
                 )
 
     def download_torrent(self, indexer_result: IndexerQueryResult) -> Torrent:
@@ -105,41 +138,32 @@ class QbittorrentDownloadClient(AbstractDownloadClient):
         :return: The torrent object with calculated hash and initial status.
         """
         torrent_hash = get_torrent_hash(torrent=indexer_result)
-        answer = None
-
-        try:
-            self.api_client.auth_log_in()
-            answer = self.api_client.torrents_add(
-                category="MediaManager",
-                urls=indexer_result.download_url,
-                save_path=indexer_result.title,
-            )
-        finally:
-            self.api_client.auth_log_out()
+        answer = self.api_client.torrents_add(
+            category="MediaManager",
+            urls=indexer_result.download_url,
+            save_path=indexer_result.title,
+        )
 
         if answer != "Ok.":
             log.error(
-                f"Failed to download torrent, API-Answer isn't 'Ok.'; API Answer: {answer}"
+                "Failed to download torrent, API-Answer isn't 'Ok.'; API Answer: %s",
+                answer,
             )
             msg = f"Failed to download torrent, API-Answer isn't 'Ok.'; API Answer: {answer}"
             raise RuntimeError(msg)
 
-        log.info(f"Successfully processed torrent: {indexer_result.title}")
+        log.info("Successfully processed torrent: %s", indexer_result.title)
 
-        # Create and return torrent object
-        torrent = Torrent(
-            status=TorrentStatus.unknown,
+        # the torrent was just accepted by qBittorrent, so it is queued for download,
+        # no need to ask qBittorrent for its status again
+        return Torrent(
+            status=TorrentStatus.downloading,
             title=indexer_result.title,
             quality=indexer_result.quality,
             imported=False,
             hash=torrent_hash,
         )
 
-        # Get initial status from download client
-        torrent.status = self.get_torrent_status(torrent)
-
-        return torrent
-
     def remove_torrent(self, torrent: Torrent, delete_data: bool = False) -> None:
         """
         Remove a torrent from the download client.
@@ -147,14 +171,11 @@ class QbittorrentDownloadClient(AbstractDownloadClient):
         :param torrent: The torrent to remove.
         :param delete_data: Whether to delete the downloaded data.
         """
-        log.info(f"Removing torrent: {torrent.title}")
-        try:
-            self.api_client.auth_log_in()
-            self.api_client.torrents_delete(
-                torrent_hashes=torrent.hash, delete_files=delete_data
-            )
-        finally:
-            self.api_client.auth_log_out()
+        log.info("Removing torrent: %s", torrent.title)
+        self.api_client.torrents_delete(
+            torrent_hashes=torrent.hash, delete_files=delete_data
+        )
+        self._invalidate_state(torrent)
 
     def get_torrent_status(self, torrent: Torrent) -> TorrentStatus:
         """
@@ -163,26 +184,58 @@ class QbittorrentDownloadClient(AbstractDownloadClient):
         :param torrent: The torrent to get the status of.
         :return: The status of the torrent.
         """
-        try:
-            self.api_client.auth_log_in()
-            info = self.api_client.torrents_info(torrent_hashes=torrent.hash)
-        finally:
-            self.api_client.auth_log_out()
+        state = self._get_states([torrent.hash]).get(torrent.hash.lower())
 
-        if not info:
-            log.warning(f"No information found for torrent: {torrent.id}")
+        if state is None:
+            log.warning("No information found for torrent: %s", torrent.id)
             return TorrentStatus.unknown
-        state: str = info[0]["state"]
-
-        if state in self.DOWNLOADING_STATE:
-            return TorrentStatus.downloading
-        if state in self.FINISHED_STATE:
-            return TorrentStatus.finished
-        if state in self.ERROR_STATE:
-            return TorrentStatus.error
-        if state in self.UNKNOWN_STATE:
-            return TorrentStatus.unknown
-        return TorrentStatus.error
+        return self._map_state(state)
+
+    def get_torrent_statuses(self, torrents: list[Torrent]) -> dict[str, TorrentStatus]:
+        """
+        Get the status of multiple torrents with a single request.
+
+        :param torrents: The torrents to get the status of.
+        :return: A mapping of torrent hash to the status of the torrent.
+        """
+        if not torrents:
+            return {}
+        states = self._get_states([torrent.hash for torrent in torrents])
+
+        statuses = {}
+        for torrent in torrents:
+            state = states.get(torrent.hash.lower())
+            if state is None:
+                log.warning("No information found for torrent: %s", torrent.id)
+                statuses[torrent.hash] = TorrentStatus.unknown
+            else:
+                statuses[torrent.hash] = self._map_state(state)
+        return statuses
+
+    def _get_states(self, torrent_hashes: list[str]) -> dict[str, str]:
+        """
+        Get the qBittorrent state of the given torrents, served from the state cache where possible.
+
+        :param torrent_hashes: The hashes of the torrents.
+        :return: A mapping of lowercase torrent hash to state, torrents unknown to qBittorrent are left out.
+        """
+        return self._state_cache.get_many([h.lower() for h in torrent_hashes])
+
+    def _fetch_states(self, torrent_hashes: list[str]) -> dict[str, str]:
+        info = self.api_client.torrents_info(torrent_hashes=torrent_hashes)
+        return {item["hash"].lower(): item["state"] for item in info}
+
+    def _invalidate_state(self, torrent: Torrent) -> None:
+        self._state_cache.invalidate(torrent.hash.lower())
+
+    def _map_state(self, state: str) -> TorrentStatus:
+        """
+        Map qBittorrent state to TorrentStatus.
+
+        :param state: The state from qBittorrent.
+        :return: The corresponding TorrentStatus.
+        """
+        return self.STATE_MAPPING.get(state, TorrentStatus.error)
 
     def pause_torrent(self, torrent: Torrent) -> None:
         """
@@ -190,11 +243,8 @@ class QbittorrentDownloadClient(AbstractDownloadClient):
 
         :param torrent: The torrent to pause.
         """
-        try:
-            self.api_client.auth_log_in()
-            self.api_client.torrents_pause(torrent_hashes=torrent.hash)
-        finally:
-            self.api_client.auth_log_out()
+        self.api_client.torrents_pause(torrent_hashes=torrent.hash)
+        self._invalidate_state(torrent)
 
     def resume_torrent(self, torrent: Torrent) -> None:
         """
@@ -202,8 +252,5 @@ class QbittorrentDownloadClient(AbstractDownloadClient):
 
         :param torrent: The torrent to resume.
         """
-        try:
-            self.api_client.auth_log_in()
-            self.api_client.torrents_resume(torrent_hashes=torrent.hash)
-        finally:
-            self.api_client.auth_log_out()
+        self.api_client.torrents_resume(torrent_hashes=torrent.hash)
+        self._invalidate_state(torrent)
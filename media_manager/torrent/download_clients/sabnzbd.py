@@ -1,8 +1,9 @@
 import logging
+from types import MappingProxyType
 
 import sabnzbd_api
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.torrent.download_clients.abstract_download_client import (
     AbstractDownloadClient,
@@ -15,20 +16,36 @@ log = logging.getLogger(__name__)
 class SabnzbdDownloadClient(AbstractDownloadClient):
     name = "sabnzbd"
 
-    DOWNLOADING_STATE = (
-        "Downloading",
-        "Queued",
-        "Paused",
-        "Extracting",
-        "Moving",
-        "Running",
+    DOWNLOADING_STATE = frozenset(
+        {
+            "Downloading",
+            "Queued",
+            "Paused",
+            "Extracting",
+            "Moving",
+            "Running",
+            # post-processing states of jobs that already moved to the history
+            "Fetching",
+            "Verifying",
+            "Repairing",
+        }
+    )
+    FINISHED_STATE = frozenset({"Completed"})
+    ERROR_STATE = frozenset({"Failed"})
+    UNKNOWN_STATE = frozenset({"Unknown"})
+
+    # SABnzbd status to TorrentStatus, statuses not listed here are treated as unknown
+    STATUS_MAPPING = MappingProxyType(
+        {
+            **dict.fromkeys(DOWNLOADING_STATE, TorrentStatus.downloading),
+            **dict.fromkeys(FINISHED_STATE, TorrentStatus.finished),
+            **dict.fromkeys(ERROR_STATE, TorrentStatus.error),
+            **dict.fromkeys(UNKNOWN_STATE, TorrentStatus.unknown),
+        }
     )
-    FINISHED_STATE = ("Completed",)
-    ERROR_STATE = ("Failed",)
-    UNKNOWN_STATE = ("Unknown",)
 
     def __init__(self) -> None:
-        self.config = MediaManagerConfig().torrents.sabnzbd
+        self.config = get_config().torrents.sabnzbd
         self.client = sabnzbd_api.SabnzbdClient(
             host=self.config.host,
             port=str(self.config.port),
@@ -60,20 +77,17 @@ class SabnzbdDownloadClient(AbstractDownloadClient):
             # Generate a hash for the NZB (using title and download URL)
             nzo_id = response["nzo_ids"][0]
 
-            # Create and return torrent object
+            # the NZB was just added to the SABnzbd queue, so it is queued for download
             torrent = Torrent(
-                status=TorrentStatus.unknown,
+                status=TorrentStatus.downloading,
                 title=indexer_result.title,
                 quality=indexer_result.quality,
                 imported=False,
                 hash=nzo_id,
                 usenet=True,
             )
-
-            # Get initial status from SABnzbd
-            torrent.status = self.get_torrent_status(torrent)
         except Exception:
-            log.exception(f"Failed to download NZB {indexer_result.title}")
+            log.exception("Failed to download NZB %s", indexer_result.title)
             raise
 
         return torrent
@@ -122,9 +136,39 @@ class SabnzbdDownloadClient(AbstractDownloadClient):
         :param torrent: The torrent to get the status of.
         :return: The status of the torrent.
         """
-        response = self.client.get_downloads(nzo_ids=torrent.hash)
-        status = response["queue"]["status"]
-        return self._map_status(status)
+        return self.get_torrent_statuses([torrent])[torrent.hash]
+
+    def get_torrent_statuses(self, torrents: list[Torrent]) -> dict[str, TorrentStatus]:
+        """
+        Get the status of multiple downloads. Jobs are looked up in the queue
+        first, jobs that already left the queue are looked up in the history.
+
+        :param torrents: The torrents to get the status of.
+        :return: A mapping of torrent hash to the status of the torrent.
+        """
+        if not torrents:
+            return {}
+        response = self.client.get_downloads(
+            nzo_ids=",".join(torrent.hash for torrent in torrents)
+        )
+        slot_statuses = {
+            slot["nzo_id"]: slot["status"]
+            for slot in response["queue"].get("slots", ())
+        }
+        finished_nzo_ids = [
+            torrent.hash for torrent in torrents if torrent.hash not in slot_statuses
+        ]
+        if finished_nzo_ids:
+            history = self.client.get_history(nzo_ids=",".join(finished_nzo_ids))
+            slot_statuses.update(
+                (slot["nzo_id"], slot["status"])
+                for slot in history["history"].get("slots", ())
+            )
+        # jobs that are neither queued nor in the history are unknown to SABnzbd
+        return {
+            torrent.hash: self._map_status(slot_statuses.get(torrent.hash, "Unknown"))
+            for torrent in torrents
+        }
 
     def _map_status(self, sabnzbd_status: str) -> TorrentStatus:
         """
@@ -133,10 +177,4 @@ class SabnzbdDownloadClient(AbstractDownloadClient):
         :param sabnzbd_status: The status from SABnzbd.
         :return: The corresponding TorrentStatus.
         """
-        if sabnzbd_status in self.DOWNLOADING_STATE:
-            return TorrentStatus.downloading
-        if sabnzbd_status in self.FINISHED_STATE:
-            return TorrentStatus.finished
-        if sabnzbd_status in self.ERROR_STATE:
-            return TorrentStatus.error
-        return TorrentStatus.unknown
+        return self.STATUS_MAPPING.get(sabnzbd_status, TorrentStatus.unknown)
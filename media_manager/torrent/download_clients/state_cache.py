@@ -0,0 +1,129 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from cachetools import TTLCache
+
+log = logging.getLogger(__name__)
+
+
+class TorrentStateCache[T]:
+    """
+    Stale-while-revalidate cache for torrent states fetched from a download client.
+
+    Entries younger than fresh_seconds are returned as they are. Entries up to
+    stale_seconds old are returned immediately while they are refreshed in a
+    background thread. Older or missing entries are fetched before returning.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[list[str]], dict[str, T]],
+        fresh_seconds: float,
+        stale_seconds: float,
+        maxsize: int = 1024,
+    ) -> None:
+        """
+        :param fetch: Fetches the states of the given keys from the download client, keys unknown to the client are left out.
+        :param fresh_seconds: How long an entry is returned without refreshing it.
+        :param stale_seconds: How long an entry is returned at all.
+        :param maxsize: The maximum number of cached entries.
+        """
+        self._fetch = fetch
+        self.fresh_seconds = fresh_seconds
+        self._entries: TTLCache[str, tuple[float, T]] = TTLCache(
+            maxsize=maxsize, ttl=stale_seconds
+        )
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        # invalidations are numbered, so fetches that were already running when
+        # a key was invalidated can leave out the state they got for that key
+        self._generation = 0
+        self._invalidated_at: dict[str, int] = {}
+        self._fetches_in_flight = 0
+
+    def get_many(self, keys: list[str]) -> dict[str, T]:
+        """
+        Get the states of the given keys.
+
+        :param keys: The keys to get the states of.
+        :return: A mapping of key to state, keys unknown to the download client are left out.
+        """
+        now = time.monotonic()
+        states: dict[str, T] = {}
+        missing_keys: list[str] = []
+        stale_keys: list[str] = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    missing_keys.append(key)
+                    continue
+                fetched_at, state = entry
+                states[key] = state
+                if now - fetched_at >= self.fresh_seconds:
+                    stale_keys.append(key)
+
+        if missing_keys:
+            # a request is needed anyway, so bring the stale entries up to date too
+            states.update(self._fetch_and_store(missing_keys + stale_keys))
+        elif stale_keys:
+            self._refresh_in_background(stale_keys)
+        return states
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop the cached state of a key, so the next read fetches it again.
+
+        :param key: The key to drop.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+            if self._fetches_in_flight:
+                self._invalidated_at[key] = self._generation
+
+    def _fetch_and_store(self, keys: list[str]) -> dict[str, T]:
+        with self._lock:
+            started_at = self._generation
+            self._fetches_in_flight += 1
+        try:
+            states = self._fetch(keys)
+        except BaseException:
+            with self._lock:
+                self._finish_fetch()
+            raise
+        # stamp the entries after the request finished, so slow requests
+        # don't use up the lifetime of their own results
+        fetched_at = time.monotonic()
+        with self._lock:
+            for key, state in states.items():
+                # the key was invalidated after the request was sent, so the
+                # state may be from before the change that invalidated it
+                if self._invalidated_at.get(key, started_at) > started_at:
+                    continue
+                self._entries[key] = (fetched_at, state)
+            self._finish_fetch()
+        return states
+
+    def _finish_fetch(self) -> None:
+        # must be called with self._lock held
+        self._fetches_in_flight -= 1
+        if not self._fetches_in_flight:
+            self._invalidated_at.clear()
+
+    def _refresh_in_background(self, keys: list[str]) -> None:
+        if not self._refresh_lock.acquire(blocking=False):
+            # another refresh is already running
+            return
+
+        def refresh() -> None:
+            try:
+                self._fetch_and_store(keys)
+            except Exception:
+                log.exception("Failed to refresh cached torrent states")
+            finally:
+                self._refresh_lock.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
@@ -3,13 +3,14 @@ from types import MappingProxyType
 
 import transmission_rpc
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.torrent.download_clients.abstract_download_client import (
     AbstractDownloadClient,
 )
+from media_manager.torrent.download_clients.state_cache import TorrentStateCache
 from media_manager.torrent.schemas import Torrent, TorrentStatus
-from media_manager.torrent.utils import get_torrent_hash
+from media_manager.torrent.utils import fetch_torrent
 
 log = logging.getLogger(__name__)
 
@@ -30,8 +31,24 @@ class TransmissionDownloadClient(AbstractDownloadClient):
         }
     )
 
+    # torrent fields needed to map a Transmission torrent to TorrentStatus
+    STATUS_FIELDS = ("id", "hashString", "status", "error", "errorString")
+
+    # torrents fetched from Transmission are reused as they are for STATE_FRESH_SECONDS,
+    # and up to STATE_STALE_SECONDS while they are refreshed in the background
+    STATE_FRESH_SECONDS = 0.5
+    STATE_STALE_SECONDS = 5
+
     def __init__(self) -> None:
-        self.config = MediaManagerConfig().torrents.transmission
+        self.config = get_config().torrents.transmission
+        self.torrent_directory = get_config().misc.torrent_directory
+        self._state_cache: TorrentStateCache[transmission_rpc.Torrent] = (
+            TorrentStateCache(
+                fetch=self._fetch_states,
+                fresh_seconds=self.STATE_FRESH_SECONDS,
+                stale_seconds=self.STATE_STALE_SECONDS,
+            )
+        )
         try:
             self._client = transmission_rpc.Client(
                 host=self.config.host,
@@ -54,26 +71,29 @@ class TransmissionDownloadClient(AbstractDownloadClient):
         :param indexer_result: The indexer query result of the torrent file to download.
         :return: The torrent object with calculated hash and initial status.
         """
-        torrent_hash = get_torrent_hash(torrent=indexer_result)
-        download_dir = (
-            MediaManagerConfig().misc.torrent_directory / indexer_result.title
-        )
+        torrent_hash, torrent_content = fetch_torrent(torrent=indexer_result)
+        download_dir = self.torrent_directory / indexer_result.title
         try:
+            # hand over the .torrent file that was already downloaded for the hash,
+            # so Transmission doesn't have to download it a second time
             self._client.add_torrent(
-                torrent=str(indexer_result.download_url),
+                torrent=torrent_content
+                if torrent_content is not None
+                else str(indexer_result.download_url),
                 download_dir=str(download_dir),
             )
 
             log.info(
-                f"Successfully added torrent to Transmission: {indexer_result.title}"
+                "Successfully added torrent to Transmission: %s", indexer_result.title
             )
 
         except Exception:
             log.exception("Failed to add torrent to Transmission")
             raise
 
-        torrent = Torrent(
-            status=TorrentStatus.unknown,
+        # the torrent was just accepted by Transmission, so it is queued for download
+        return Torrent(
+            status=TorrentStatus.downloading,
             title=indexer_result.title,
             quality=indexer_result.quality,
             imported=False,
@@ -81,10 +101,6 @@ class TransmissionDownloadClient(AbstractDownloadClient):
             usenet=False,
         )
 
-        torrent.status = self.get_torrent_status(torrent)
-
-        return torrent
-
     def remove_torrent(self, torrent: Torrent, delete_data: bool = False) -> None:
         """
         Remove a torrent from the Transmission client.
@@ -98,6 +114,8 @@ class TransmissionDownloadClient(AbstractDownloadClient):
         except Exception:
             log.exception("Failed to remove torrent")
             raise
+        finally:
+            self._invalidate_state(torrent)
 
     def get_torrent_status(self, torrent: Torrent) -> TorrentStatus:
         """
@@ -108,27 +126,89 @@ class TransmissionDownloadClient(AbstractDownloadClient):
         """
 
         try:
-            transmission_torrent = self._client.get_torrent(torrent.hash)
+            transmission_torrent = self._get_states([torrent.hash]).get(
+                torrent.hash.lower()
+            )
 
             if transmission_torrent is None:
                 log.warning(f"Torrent not found in Transmission: {torrent.hash}")
                 return TorrentStatus.unknown
 
-            status = self.STATUS_MAPPING.get(
-                transmission_torrent.status, TorrentStatus.unknown
-            )
-
-            if transmission_torrent.error != 0:
-                status = TorrentStatus.error
-                log.warning(
-                    f"Torrent {torrent.title} has error status: {transmission_torrent.error_string}"
-                )
+            status = self._map_status(transmission_torrent, torrent)
         except Exception:
             log.exception("Failed to get torrent status")
             return TorrentStatus.error
 
         return status
 
+    def get_torrent_statuses(self, torrents: list[Torrent]) -> dict[str, TorrentStatus]:
+        """
+        Get the status of multiple torrents with a single request.
+
+        :param torrents: The torrents to get the status of.
+        :return: A mapping of torrent hash to the status of the torrent.
+        """
+        if not torrents:
+            return {}
+        try:
+            by_hash = self._get_states([torrent.hash for torrent in torrents])
+        except Exception:
+            log.exception("Failed to get torrent statuses")
+            return dict.fromkeys(
+                (torrent.hash for torrent in torrents), TorrentStatus.error
+            )
+
+        statuses = {}
+        for torrent in torrents:
+            transmission_torrent = by_hash.get(torrent.hash.lower())
+            if transmission_torrent is None:
+                log.warning(f"Torrent not found in Transmission: {torrent.hash}")
+                statuses[torrent.hash] = TorrentStatus.unknown
+            else:
+                statuses[torrent.hash] = self._map_status(transmission_torrent, torrent)
+        return statuses
+
+    def _get_states(
+        self, torrent_hashes: list[str]
+    ) -> dict[str, transmission_rpc.Torrent]:
+        """
+        Get the Transmission torrents with the given hashes, served from the state cache where possible.
+
+        :param torrent_hashes: The hashes of the torrents.
+        :return: A mapping of lowercase torrent hash to torrent, torrents unknown to Transmission are left out.
+        """
+        return self._state_cache.get_many([h.lower() for h in torrent_hashes])
+
+    def _fetch_states(
+        self, torrent_hashes: list[str]
+    ) -> dict[str, transmission_rpc.Torrent]:
+        transmission_torrents = self._client.get_torrents(
+            ids=torrent_hashes, arguments=list(self.STATUS_FIELDS)
+        )
+        return {t.hash_string.lower(): t for t in transmission_torrents}
+
+    def _invalidate_state(self, torrent: Torrent) -> None:
+        self._state_cache.invalidate(torrent.hash.lower())
+
+    def _map_status(
+        self, transmission_torrent: transmission_rpc.Torrent, torrent: Torrent
+    ) -> TorrentStatus:
+        """
+        Map the state of a Transmission torrent to TorrentStatus.
+
+        :param transmission_torrent: The torrent as returned by Transmission.
+        :param torrent: The torrent the state belongs to.
+        :return: The corresponding TorrentStatus.
+        """
+        if transmission_torrent.error != 0:
+            log.warning(
+                f"Torrent {torrent.title} has error status: {transmission_torrent.error_string}"
+            )
+            return TorrentStatus.error
+        return self.STATUS_MAPPING.get(
+            transmission_torrent.status, TorrentStatus.unknown
+        )
+
     def pause_torrent(self, torrent: Torrent) -> None:
         """
         Pause a torrent download.
@@ -142,6 +222,8 @@ class TransmissionDownloadClient(AbstractDownloadClient):
         except Exception:
             log.exception("Failed to pause torrent")
             raise
+        finally:
+            self._invalidate_state(torrent)
 
     def resume_torrent(self, torrent: Torrent) -> None:
         """
@@ -156,3 +238,5 @@ class TransmissionDownloadClient(AbstractDownloadClient):
         except Exception:
             log.exception("Failed to resume torrent")
             raise
+        finally:
+            self._invalidate_state(torrent)
@@ -1,7 +1,11 @@
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import cache
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.torrent.download_clients.abstract_download_client import (
     AbstractDownloadClient,
@@ -30,17 +34,27 @@ class DownloadManager:
     Only one torrent client and one usenet client are active at a time.
     """
 
+    # clients that could not be reached are dialled again at most this often
+    CLIENT_RETRY_INTERVAL_SECONDS = 30
+
     def __init__(self) -> None:
         self._torrent_client: AbstractDownloadClient | None = None
         self._usenet_client: AbstractDownloadClient | None = None
-        self.config = MediaManagerConfig().torrents
+        self.config = get_config().torrents
+        # the manager is shared by request threads and the scheduler
+        self._initialize_lock = threading.Lock()
+        self._initialized_at = time.monotonic()
         self._initialize_clients()
 
     def _initialize_clients(self) -> None:
-        """Initialize and register the default download clients"""
+        """
+        Initialize and register the default download clients.
+        Clients that are already initialized are kept, so this can be called again
+        to retry clients that failed to initialize.
+        """
 
         # Initialize torrent clients (prioritize qBittorrent, fallback to Transmission)
-        if self.config.qbittorrent.enabled:
+        if self._torrent_client is None and self.config.qbittorrent.enabled:
             try:
                 self._torrent_client = QbittorrentDownloadClient()
             except Exception:
@@ -54,7 +68,7 @@ class DownloadManager:
                 log.exception("Failed to initialize Transmission client")
 
         # Initialize SABnzbd client for usenet
-        if self.config.sabnzbd.enabled:
+        if self._usenet_client is None and self.config.sabnzbd.enabled:
             try:
                 self._usenet_client = SabnzbdDownloadClient()
             except Exception:
@@ -76,6 +90,17 @@ class DownloadManager:
         :return: The appropriate download client
         :raises RuntimeError: If no suitable client is available
         """
+        # retry clients that could not be reached when the manager was created
+        if self._is_client_missing(indexer_result):
+            with self._initialize_lock:
+                retry_due = (
+                    time.monotonic() - self._initialized_at
+                    >= self.CLIENT_RETRY_INTERVAL_SECONDS
+                )
+                if self._is_client_missing(indexer_result) and retry_due:
+                    self._initialize_clients()
+                    self._initialized_at = time.monotonic()
+
         # Use the usenet flag from the indexer result to determine the client type
         if indexer_result.usenet:
             if not self._usenet_client:
@@ -87,6 +112,11 @@ class DownloadManager:
             raise RuntimeError(msg)
         return self._torrent_client
 
+    def _is_client_missing(self, indexer_result: IndexerQueryResult | Torrent) -> bool:
+        if indexer_result.usenet:
+            return self._usenet_client is None
+        return self._torrent_client is None
+
     def download(self, indexer_result: IndexerQueryResult) -> Torrent:
         """
         Download content using the appropriate client
@@ -94,7 +124,7 @@ class DownloadManager:
         :param indexer_result: The indexer query result to download
         :return: The torrent object representing the download
         """
-        log.info(f"Processing download request for: {indexer_result.title}")
+        log.info("Processing download request for: %s", indexer_result.title)
 
         client = self._get_appropriate_client(indexer_result)
         return client.download_torrent(indexer_result)
@@ -121,6 +151,42 @@ class DownloadManager:
         client = self._get_appropriate_client(torrent)
         return client.get_torrent_status(torrent)
 
+    def get_torrent_statuses(self, torrents: list[Torrent]) -> dict[str, TorrentStatus]:
+        """
+        Get the status of multiple torrents, querying each download client once.
+        The torrent and usenet clients are queried concurrently.
+        Torrents whose download client is not configured are left out of the result.
+
+        :param torrents: The torrents to get the status for
+        :return: A mapping of torrent hash to the current status of the torrent
+        """
+        batches: list[tuple[AbstractDownloadClient, list[Torrent]]] = []
+        for usenet in (False, True):
+            client_torrents = [t for t in torrents if t.usenet == usenet]
+            if not client_torrents:
+                continue
+            try:
+                client = self._get_appropriate_client(client_torrents[0])
+            except RuntimeError:
+                log.exception(f"Cannot fetch status of {len(client_torrents)} torrents")
+                continue
+            batches.append((client, client_torrents))
+
+        statuses: dict[str, TorrentStatus] = {}
+        if len(batches) == 1:
+            client, client_torrents = batches[0]
+            statuses.update(client.get_torrent_statuses(client_torrents))
+        elif batches:
+            # the clients are separate servers, so wait for the slower one only
+            with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                futures = [
+                    executor.submit(client.get_torrent_statuses, client_torrents)
+                    for client, client_torrents in batches
+                ]
+                for future in futures:
+                    statuses.update(future.result())
+        return statuses
+
     def pause_torrent(self, torrent: Torrent) -> None:
         """
         Pause a torrent using the appropriate client
@@ -142,3 +208,12 @@ class DownloadManager:
 
         client = self._get_appropriate_client(torrent)
         client.resume_torrent(torrent)
+
+
+@cache
+def get_download_manager() -> DownloadManager:
+    """
+    Returns the process-wide DownloadManager, so the download clients and their
+    logged-in HTTP sessions are reused instead of being rebuilt on every request.
+    """
+    return DownloadManager()
@@ -1,4 +1,11 @@
-from sqlalchemy import delete, select
+from collections.abc import Iterable
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import Row, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.expression import false
 
 from media_manager.database import DbSessionDependency
 from media_manager.exceptions import NotFoundError
@@ -12,6 +19,47 @@ from media_manager.tv.models import Episode, EpisodeFile, Season, Show
 from media_manager.tv.schemas import EpisodeFile as EpisodeFileSchema
 from media_manager.tv.schemas import Show as ShowSchema
 
+# the columns of each table are named like the fields of its schema, so the
+# selected rows can be turned into schemas by name
+TORRENT_COLUMNS = (
+    Torrent.id,
+    Torrent.status,
+    Torrent.title,
+    Torrent.quality,
+    Torrent.imported,
+    Torrent.hash,
+    Torrent.usenet,
+)
+# built once, the statements never change between calls
+SELECT_TORRENTS = select(*TORRENT_COLUMNS)
+SELECT_UNIMPORTED_TORRENTS = SELECT_TORRENTS.where(Torrent.imported == false())
+
+EPISODE_FILE_COLUMNS = (
+    EpisodeFile.episode_id,
+    EpisodeFile.quality,
+    EpisodeFile.torrent_id,
+    EpisodeFile.file_path_suffix,
+)
+MOVIE_FILE_COLUMNS = (
+    MovieFile.movie_id,
+    MovieFile.file_path_suffix,
+    MovieFile.quality,
+    MovieFile.torrent_id,
+)
+
+
+def construct_from_rows[SchemaT: BaseModel](
+    schema: type[SchemaT], rows: Iterable[Row]
+) -> list[SchemaT]:
+    """
+    Build schemas from rows of typed columns without validating them again.
+
+    :param schema: The schema to build, its fields must match the column names.
+    :param rows: The rows selected from the database.
+    :return: The schemas, in the order of the rows.
+    """
+    return [schema.model_construct(**row._mapping) for row in rows]
+
 
 class TorrentRepository:
     def __init__(self, db: DbSessionDependency) -> None:
@@ -20,44 +68,105 @@ class TorrentRepository:
     def get_episode_files_of_torrent(
         self, torrent_id: TorrentId
     ) -> list[EpisodeFileSchema]:
-        stmt = select(EpisodeFile).where(EpisodeFile.torrent_id == torrent_id)
-        result = self.db.execute(stmt).scalars().all()
-        return [
-            EpisodeFileSchema.model_validate(episode_file) for episode_file in result
-        ]
+        stmt = select(*EPISODE_FILE_COLUMNS).where(EpisodeFile.torrent_id == torrent_id)
+        return construct_from_rows(EpisodeFileSchema, self.db.execute(stmt))
 
     def get_show_of_torrent(self, torrent_id: TorrentId) -> ShowSchema | None:
+        # resolve the id first, so the joined file rows don't have to be de-duplicated
         stmt = (
-            select(Show)
-            .join(Show.seasons)
+            select(Season.show_id)
             .join(Season.episodes)
             .join(Episode.episode_files)
             .where(EpisodeFile.torrent_id == torrent_id)
+            .limit(1)
         )
-        result = self.db.execute(stmt).unique().scalar_one_or_none()
-        if result is None:
+        show_id = self.db.execute(stmt).scalar_one_or_none()
+        if show_id is None:
             return None
+        result = self.db.get(
+            Show,
+            show_id,
+            options=[selectinload(Show.seasons).selectinload(Season.episodes)],
+        )
         return ShowSchema.model_validate(result)
 
+    def get_shows_of_torrents(
+        self, torrent_ids: list[TorrentId]
+    ) -> dict[TorrentId, ShowSchema]:
+        """
+        Get the shows of multiple torrents with a single query.
+
+        :param torrent_ids: The IDs of the torrents.
+        :return: A mapping of torrent ID to show, torrents without episode files are left out.
+        """
+        if not torrent_ids:
+            return {}
+        stmt = (
+            select(EpisodeFile.torrent_id, Show)
+            .distinct()
+            .join(Show.seasons)
+            .join(Season.episodes)
+            .join(Episode.episode_files)
+            .where(EpisodeFile.torrent_id.in_(torrent_ids))
+            .options(selectinload(Show.seasons).selectinload(Season.episodes))
+        )
+        result = self.db.execute(stmt).all()
+
+        # several torrents can belong to the same show, validate each show once
+        show_schemas: dict[UUID, ShowSchema] = {}
+        shows = {}
+        for torrent_id, show in result:
+            if show.id not in show_schemas:
+                show_schemas[show.id] = ShowSchema.model_validate(show)
+            shows[torrent_id] = show_schemas[show.id]
+        return shows
+
     def save_torrent(self, torrent: TorrentSchema) -> TorrentSchema:
-        self.db.merge(Torrent(**torrent.model_dump()))
+        self._upsert_torrents([torrent])
         self.db.commit()
         return TorrentSchema.model_validate(torrent)
 
-    def get_all_torrents(self) -> list[TorrentSchema]:
-        stmt = select(Torrent)
-        result = self.db.execute(stmt).scalars().all()
+    def save_torrents(self, torrents: list[TorrentSchema]) -> None:
+        if not torrents:
+            return
+        self._upsert_torrents(torrents)
+        self.db.commit()
+
+    def _upsert_torrents(self, torrents: list[TorrentSchema]) -> None:
+        # INSERT ... ON CONFLICT DO UPDATE writes new and existing torrents in
+        # one statement, without the SELECT that session.merge() issues per row
+        stmt = insert(Torrent)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Torrent.id],
+            set_={
+                column.name: stmt.excluded[column.name]
+                for column in Torrent.__table__.columns
+                if not column.primary_key
+            },
+        )
+        self.db.execute(stmt, [torrent.model_dump() for torrent in torrents])
+
+    def get_all_torrents(
+        self, limit: int | None = None, offset: int = 0
+    ) -> list[TorrentSchema]:
+        stmt = SELECT_TORRENTS
+        if limit is not None or offset:
+            # pages are only stable with a fixed order
+            stmt = stmt.order_by(Torrent.id).limit(limit).offset(offset)
+        return construct_from_rows(TorrentSchema, self.db.execute(stmt))
 
-        return [
-            TorrentSchema.model_validate(torrent_schema) for torrent_schema in result
-        ]
+    def get_unimported_torrents(self) -> list[TorrentSchema]:
+        return construct_from_rows(
+            TorrentSchema, self.db.execute(SELECT_UNIMPORTED_TORRENTS)
+        )
 
     def get_torrent_by_id(self, torrent_id: TorrentId) -> TorrentSchema:
-        result = self.db.get(Torrent, torrent_id)
+        stmt = SELECT_TORRENTS.where(Torrent.id == torrent_id)
+        result = self.db.execute(stmt).one_or_none()
         if result is None:
             msg = f"Torrent with ID {torrent_id} not found."
             raise NotFoundError(msg)
-        return TorrentSchema.model_validate(result)
+        return TorrentSchema.model_construct(**result._mapping)
 
     def delete_torrent(
         self, torrent_id: TorrentId, delete_associated_media_files: bool = False
@@ -73,22 +182,49 @@ class TorrentRepository:
             )
             self.db.execute(episode_files_stmt)
 
-        self.db.delete(self.db.get(Torrent, torrent_id))
+        # the file rows that are kept get their torrent_id cleared by the
+        # ON DELETE SET NULL foreign keys, so there is no need to load them
+        result = self.db.execute(delete(Torrent).where(Torrent.id == torrent_id))
+        if result.rowcount == 0:
+            msg = f"Torrent with ID {torrent_id} not found."
+            raise NotFoundError(msg)
 
     def get_movie_of_torrent(self, torrent_id: TorrentId) -> MovieSchema | None:
         stmt = (
-            select(Movie)
-            .join(MovieFile, Movie.id == MovieFile.movie_id)
+            select(MovieFile.movie_id)
             .where(MovieFile.torrent_id == torrent_id)
+            .limit(1)
         )
-        result = self.db.execute(stmt).unique().scalar_one_or_none()
-        if result is None:
+        movie_id = self.db.execute(stmt).scalar_one_or_none()
+        if movie_id is None:
             return None
-        return MovieSchema.model_validate(result)
+        return MovieSchema.model_validate(self.db.get(Movie, movie_id))
+
+    def get_movies_of_torrents(
+        self, torrent_ids: list[TorrentId]
+    ) -> dict[TorrentId, MovieSchema]:
+        """
+        Get the movies of multiple torrents with a single query.
+
+        :param torrent_ids: The IDs of the torrents.
+        :return: A mapping of torrent ID to movie, torrents without movie files are left out.
+        """
+        if not torrent_ids:
+            return {}
+        stmt = (
+            select(MovieFile.torrent_id, Movie)
+            .join(MovieFile, Movie.id == MovieFile.movie_id)
+            .where(MovieFile.torrent_id.in_(torrent_ids))
+            .distinct()
+        )
+        result = self.db.execute(stmt).all()
+        return {
+            torrent_id: MovieSchema.model_validate(movie)
+            for torrent_id, movie in result
+        }
 
     def get_movie_files_of_torrent(
         self, torrent_id: TorrentId
     ) -> list[MovieFileSchema]:
-        stmt = select(MovieFile).where(MovieFile.torrent_id == torrent_id)
-        result = self.db.execute(stmt).scalars().all()
-        return [MovieFileSchema.model_validate(movie_file) for movie_file in result]
+        stmt = select(*MOVIE_FILE_COLUMNS).where(MovieFile.torrent_id == torrent_id)
+        return construct_from_rows(MovieFileSchema, self.db.execute(stmt))
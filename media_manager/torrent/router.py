@@ -1,6 +1,9 @@
-from fastapi import APIRouter, status
+import hashlib
+
+from fastapi import APIRouter, Request, Response, status
 from fastapi.exceptions import HTTPException
 from fastapi.params import Depends
+from pydantic import TypeAdapter
 
 from media_manager.auth.users import current_active_user, current_superuser
 from media_manager.torrent.dependencies import (
@@ -12,14 +15,54 @@ from media_manager.torrent.schemas import Torrent, TorrentStatus
 
 router = APIRouter()
 
+TORRENT_LIST_ADAPTER = TypeAdapter(list[Torrent])
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag, using weak comparison.
+
+    :param if_none_match: The value of the If-None-Match header, if sent.
+    :param etag: The quoted ETag of the current response.
+    :return: True if the header lists the ETag or is "*".
+    """
+    if if_none_match is None:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(current_active_user)],
+    response_model=list[Torrent],
 )
-def get_all_torrents(service: torrent_service_dep) -> list[Torrent]:
-    return service.get_all_torrents()
+def get_all_torrents(
+    request: Request,
+    service: torrent_service_dep,
+    limit: int | None = None,
+    offset: int = 0,
+) -> Response:
+    if (limit is not None and limit < 1) or offset < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="limit must be positive and offset must not be negative",
+        )
+    torrents = service.get_all_torrents(limit=limit, offset=offset)
+
+    # the list is polled by the web UI, let clients revalidate instead of
+    # downloading the same list again
+    body = TORRENT_LIST_ADAPTER.dump_json(torrents)
+    etag = f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{torrent_id}", status_code=status.HTTP_200_OK)
@@ -2,7 +2,7 @@ import logging
 
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.movies.schemas import Movie, MovieFile
-from media_manager.torrent.manager import DownloadManager
+from media_manager.torrent.manager import DownloadManager, get_download_manager
 from media_manager.torrent.repository import TorrentRepository
 from media_manager.torrent.schemas import Torrent, TorrentId
 from media_manager.tv.schemas import EpisodeFile, Show
@@ -17,7 +17,7 @@ class TorrentService:
         download_manager: DownloadManager | None = None,
     ) -> None:
         self.torrent_repository = torrent_repository
-        self.download_manager = download_manager or DownloadManager()
+        self.download_manager = download_manager or get_download_manager()
 
     def get_episode_files_of_torrent(self, torrent: Torrent) -> list[EpisodeFile]:
         """
@@ -45,8 +45,28 @@ class TorrentService:
         """
         return self.torrent_repository.get_movie_of_torrent(torrent_id=torrent.id)
 
+    def get_shows_of_torrents(self, torrents: list[Torrent]) -> dict[TorrentId, Show]:
+        """
+        Returns the shows of multiple torrents, fetched with a single query
+        :param torrents: the torrents to get the shows of
+        :return: mapping of torrent id to show, torrents without a show are left out
+        """
+        return self.torrent_repository.get_shows_of_torrents(
+            torrent_ids=[torrent.id for torrent in torrents]
+        )
+
+    def get_movies_of_torrents(self, torrents: list[Torrent]) -> dict[TorrentId, Movie]:
+        """
+        Returns the movies of multiple torrents, fetched with a single query
+        :param torrents: the torrents to get the movies of
+        :return: mapping of torrent id to movie, torrents without a movie are left out
+        """
+        return self.torrent_repository.get_movies_of_torrents(
+            torrent_ids=[torrent.id for torrent in torrents]
+        )
+
     def download(self, indexer_result: IndexerQueryResult) -> Torrent:
-        log.info(f"Starting download for torrent: {indexer_result.title}")
+        log.info("Starting download for torrent: %s", indexer_result.title)
         torrent = self.download_manager.download(indexer_result)
 
         return self.torrent_repository.save_torrent(torrent=torrent)
@@ -87,14 +107,45 @@ class TorrentService:
         self.download_manager.resume_torrent(torrent)
         return self.get_torrent_status(torrent=torrent)
 
-    def get_all_torrents(self) -> list[Torrent]:
-        torrents = []
-        for x in self.torrent_repository.get_all_torrents():
-            try:
-                torrents.append(self.get_torrent_status(x))
-            except RuntimeError:
-                log.exception(f"Error fetching status for torrent {x.title}")
-        return torrents
+    def get_all_torrents(
+        self, limit: int | None = None, offset: int = 0
+    ) -> list[Torrent]:
+        """
+        Returns all torrents with their status refreshed, optionally one page at a time.
+
+        :param limit: The maximum number of torrents to return, None returns all of them.
+        :param offset: The number of torrents to skip.
+        :return: list of torrents
+        """
+        return self._refresh_torrent_statuses(
+            self.torrent_repository.get_all_torrents(limit=limit, offset=offset)
+        )
+
+    def get_unimported_torrents(self) -> list[Torrent]:
+        """
+        Returns all torrents that have not been imported yet, with their status refreshed
+        :return: list of torrents that are not imported
+        """
+        return self._refresh_torrent_statuses(
+            self.torrent_repository.get_unimported_torrents()
+        )
+
+    def _refresh_torrent_statuses(self, torrents: list[Torrent]) -> list[Torrent]:
+        """
+        Fetches the current status of all given torrents with one request per
+        download client and persists them in a single transaction.
+        Torrents whose status could not be fetched are left out.
+        """
+        statuses = self.download_manager.get_torrent_statuses(torrents)
+        refreshed_torrents = []
+        for x in torrents:
+            status = statuses.get(x.hash)
+            if status is None:
+                continue
+            x.status = status
+            refreshed_torrents.append(x)
+        self.torrent_repository.save_torrents(torrents=refreshed_torrents)
+        return refreshed_torrents
 
     def get_torrent_by_id(self, torrent_id: TorrentId) -> Torrent:
         return self.get_torrent_status(
@@ -1,79 +1,231 @@
 import hashlib
 import logging
-import mimetypes
+import os
 import re
 import shutil
+import tarfile
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path, UnsupportedOperation
 
-import bencoder
 import patoolib
 import requests
 import torf
 from pathvalidate import sanitize_filename
 from requests.exceptions import InvalidSchema
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.indexer.schemas import IndexerQueryResult
 from media_manager.indexer.utils import follow_redirects_to_final_torrent_url
 from media_manager.torrent.schemas import Torrent
 
 log = logging.getLogger(__name__)
 
+# shared between downloads so connections to the indexers are kept alive
+torrent_file_session = requests.Session()
+
+# files are classified by their lowercased suffix, a set lookup instead of
+# going through mimetypes for every file
+VIDEO_SUFFIXES = frozenset(
+    {
+        ".3g2",
+        ".3gp",
+        ".asf",
+        ".avi",
+        ".divx",
+        ".f4v",
+        ".flv",
+        ".m1v",
+        ".m2ts",
+        ".m4v",
+        ".mkv",
+        ".mov",
+        ".movie",
+        ".mp4",
+        ".mpe",
+        ".mpeg",
+        ".mpg",
+        ".mts",
+        ".ogv",
+        ".qt",
+        ".rm",
+        ".rmvb",
+        ".ts",
+        ".vob",
+        ".webm",
+        ".wmv",
+    }
+)
+SUBTITLE_SUFFIXES = frozenset({".srt"})
+
+# archives that are extracted with zipfile/tarfile instead of patool
+IN_PROCESS_ARCHIVE_SUFFIXES = frozenset({".zip", ".tar", ".tgz", ".tbz2", ".txz"})
+# rar and 7z still need the external tools
+PATOOL_ARCHIVE_SUFFIXES = frozenset({".rar", ".7z", ".arc", ".bz"})
+# compression suffixes that make a compressed tarball when following .tar
+TAR_COMPRESSION_SUFFIXES = frozenset({".gz", ".bz2", ".xz"})
+
+# compiled once, the title helpers run for every file and directory of an import
+SPECIAL_CHARACTERS_TABLE = str.maketrans("", "", '<>:"/\\|?*')
+OPENING_BRACKETS = frozenset("[{(")
+# negated classes instead of lazy .*?, which tries to end the match at every
+# character, \n is excluded because . never matched it
+SQUARE_BRACKETS_PATTERN = re.compile(r"\[[^\]\n]*\]")
+CURLY_BRACKETS_PATTERN = re.compile(r"\{[^}\n]*\}")
+YEAR_IN_PARENTHESES_PATTERN = re.compile(r"\(\d{4}\)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+EXTERNAL_ID_PATTERN = re.compile(r"\b(tmdb|tvdb)(?:id)?[-_]?([0-9]+)\b", re.IGNORECASE)
+
 
 def list_files_recursively(path: Path = Path()) -> list[Path]:
-    files = list(path.glob("**/*"))
-    log.debug(f"Found {len(files)} entries via glob")
-    valid_files = []
-    for x in files:
-        if x.is_dir():
-            log.debug(f"'{x}' is a directory")
-        elif x.is_symlink():
-            log.debug(f"'{x}' is a symlink")
-        else:
-            valid_files.append(x)
-    log.debug(f"Returning {len(valid_files)} files after filtering")
+    valid_files: list[Path] = []
+    try:
+        with os.scandir(path) as entries:
+            _collect_files(entries, valid_files)
+    except (FileNotFoundError, NotADirectoryError):
+        log.debug("'%s' is not a directory", path)
+    except OSError:
+        log.warning("Could not list the files in '%s'", path, exc_info=True)
+    log.debug("Returning %d files after filtering", len(valid_files))
     return valid_files
 
 
-def extract_archives(files: list) -> None:
-    archive_types = {
-        "application/zip",
-        "application/x-zip-compressedapplication/x-compressed",
-        "application/vnd.rar",
-        "application/x-7z-compressed",
-        "application/x-freearc",
-        "application/x-bzip",
-        "application/x-bzip2",
-        "application/gzip",
-        "application/x-gzip",
-        "application/x-tar",
-    }
-    for file in files:
-        file_type = mimetypes.guess_type(file)
-        log.debug(f"File: {file}, Size: {file.stat().st_size} bytes, Type: {file_type}")
+def _collect_files(entries: Iterator[os.DirEntry[str]], files: list[Path]) -> None:
+    # the entry types come with the directory listing, so unlike Path.glob()
+    # followed by is_dir()/is_symlink() this needs no stat call per entry
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            # an unreadable or vanished subdirectory is skipped like Path.glob()
+            # did, the rest of the walk goes on
+            try:
+                with os.scandir(entry.path) as subdirectory_entries:
+                    _collect_files(subdirectory_entries, files)
+            except OSError:
+                log.warning(
+                    "Could not list the files in '%s', skipping it",
+                    entry.path,
+                    exc_info=True,
+                )
+        elif entry.is_symlink():
+            log.debug("'%s' is a symlink", entry.path)
+        else:
+            files.append(Path(entry.path))
 
-        if file_type[0] in archive_types:
-            log.info(
-                f"File {file} is a compressed file, extracting it into directory {file.parent}"
+
+def extract_archives(files: list) -> bool:
+    """
+    Extracts all archives among the given files into their parent directories.
+
+    :param files: The files to check for archives.
+    :return: Whether any archive was extracted.
+    """
+    archives_by_directory: dict[Path, list[Path]] = {}
+    for file in files:
+        archive_suffix = get_archive_suffix(file)
+        # the size costs a stat call per file, only look it up for debug logging
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "File: %s, Size: %d bytes, Archive type: %s",
+                file,
+                file.stat().st_size,
+                archive_suffix,
             )
-            try:
+        if archive_suffix is not None:
+            archives_by_directory.setdefault(file.parent, []).append(file)
+
+    if not archives_by_directory:
+        return False
+    directories = list(archives_by_directory.values())
+    if len(directories) == 1:
+        return extract_archives_in_directory(directories[0])
+
+    # archives in different directories can't write to the same files, so they
+    # are extracted in parallel, the ones sharing a directory one after another
+    with ThreadPoolExecutor(
+        max_workers=min(len(directories), os.cpu_count() or 1)
+    ) as executor:
+        return any(list(executor.map(extract_archives_in_directory, directories)))
+
+
+def extract_archives_in_directory(archives: list[Path]) -> bool:
+    """
+    Extracts the given archives of one directory one after another.
+
+    :param archives: The archives to extract.
+    :return: Whether any archive was extracted.
+    """
+    extracted = False
+    for file in archives:
+        log.info(
+            f"File {file} is a compressed file, extracting it into directory {file.parent}"
+        )
+        try:
+            if get_archive_suffix(file) in IN_PROCESS_ARCHIVE_SUFFIXES:
+                extract_archive_in_process(file)
+            else:
                 patoolib.extract_archive(str(file), outdir=str(file.parent))
-            except patoolib.util.PatoolError:
-                log.exception(f"Failed to extract archive {file}")
+        except (
+            patoolib.util.PatoolError,
+            zipfile.BadZipFile,
+            tarfile.TarError,
+        ):
+            log.exception(f"Failed to extract archive {file}")
+        else:
+            extracted = True
+    return extracted
+
+
+def get_archive_suffix(file: Path) -> str | None:
+    """
+    Returns the archive suffix of a file, compressed tarballs like .tar.gz count as .tar.
+
+    :param file: The file to check.
+    :return: The lowercased archive suffix, or None if the file is not an archive.
+    """
+    suffix = file.suffix.lower()
+    if suffix in TAR_COMPRESSION_SUFFIXES and file.stem.lower().endswith(".tar"):
+        return ".tar"
+    if suffix in IN_PROCESS_ARCHIVE_SUFFIXES or suffix in PATOOL_ARCHIVE_SUFFIXES:
+        return suffix
+    return None
+
+
+def extract_archive_in_process(file: Path) -> None:
+    """
+    Extracts a zip or tar archive into its parent directory using the standard
+    library, without spawning an external extraction tool through patool.
+
+    :param file: The archive to extract.
+    """
+    if zipfile.is_zipfile(file):
+        with zipfile.ZipFile(file) as zip_archive:
+            # zipfile strips absolute paths and ".." from member names itself
+            zip_archive.extractall(path=file.parent)  # noqa: S202
+    else:
+        with tarfile.open(file) as tar_archive:
+            tar_archive.extractall(path=file.parent, filter="data")
 
 
 def get_torrent_filepath(torrent: Torrent) -> Path:
-    return MediaManagerConfig().misc.torrent_directory / torrent.title
+    return get_config().misc.torrent_directory / torrent.title
 
 
 def import_file(target_file: Path, source_file: Path) -> None:
-    if target_file.exists():
-        target_file.unlink()
-
     try:
-        target_file.hardlink_to(source_file)
-    except FileExistsError:
-        log.exception(f"File already exists at {target_file}.")
+        try:
+            target_file.hardlink_to(source_file)
+        except FileExistsError:
+            if target_file.samefile(source_file):
+                log.debug(f"File {target_file} is already imported.")
+                return
+            # link next to the existing file and rename it over it, so the target
+            # is replaced atomically and never missing
+            temporary_file = target_file.with_name(f".{target_file.name}.tmp")
+            temporary_file.unlink(missing_ok=True)
+            temporary_file.hardlink_to(source_file)
+            temporary_file.replace(target_file)
     except (OSError, UnsupportedOperation, NotImplementedError):
         log.exception(
             f"Failed to create hardlink from {source_file} to {target_file}. Falling back to copying the file."
@@ -100,24 +252,25 @@ def get_files_for_import(
 
     all_files: list[Path] = list_files_recursively(path=search_directory)
     log.debug(f"Found {len(all_files)} files downloaded by the torrent")
-    extract_archives(all_files)
-    all_files = list_files_recursively(path=search_directory)
+    if extract_archives(all_files):
+        # only walk the directory again if extracting added files to it
+        all_files = list_files_recursively(path=search_directory)
 
     video_files: list[Path] = []
     subtitle_files: list[Path] = []
     for file in all_files:
-        file_type, _ = mimetypes.guess_type(str(file))
-        if file_type is not None:
-            if file_type.startswith("video"):
-                video_files.append(file)
-                log.debug(f"File is a video, it will be imported: {file}")
-            elif file_type.startswith("text") and Path(file).suffix == ".srt":
-                subtitle_files.append(file)
-                log.debug(f"File is a subtitle, it will be imported: {file}")
-            else:
-                log.debug(
-                    f"File is neither a video nor a subtitle, will not be imported: {file}"
-                )
+        suffix = file.suffix.lower()
+        if suffix in VIDEO_SUFFIXES:
+            video_files.append(file)
+            log.debug("File is a video, it will be imported: %s", file)
+        elif suffix in SUBTITLE_SUFFIXES:
+            subtitle_files.append(file)
+            log.debug("File is a subtitle, it will be imported: %s", file)
+        else:
+            log.debug(
+                "File is neither a video nor a subtitle, will not be imported: %s",
+                file,
+            )
 
     log.info(
         f"Found {len(all_files)} files ({len(video_files)} video files, {len(subtitle_files)} subtitle files) for further processing."
@@ -132,32 +285,43 @@ def get_torrent_hash(torrent: IndexerQueryResult) -> str:
     :param torrent: The torrent object.
     :return: The hash of the torrent.
     """
+    return fetch_torrent(torrent=torrent)[0]
+
+
+def fetch_torrent(torrent: IndexerQueryResult) -> tuple[str, bytes | None]:
+    """
+    Get the torrent hash and, unless the torrent is a magnet link, the content of its .torrent file.
+
+    :param torrent: The torrent object.
+    :return: The hash of the torrent and the content of the .torrent file, None for magnet links.
+    """
+    torrent_content = None
     torrent_filepath = (
-        MediaManagerConfig().misc.torrent_directory
+        get_config().misc.torrent_directory
         / f"{sanitize_filename(torrent.title)}.torrent"
     )
     if torrent_filepath.exists():
-        log.warning(f"Torrent file already exists at: {torrent_filepath}")
+        log.warning("Torrent file already exists at: %s", torrent_filepath)
 
     if torrent.download_url.startswith("magnet:"):
-        log.info(f"Parsing torrent with magnet URL: {torrent.title}")
-        log.debug(f"Magnet URL: {torrent.download_url}")
+        log.info("Parsing torrent with magnet URL: %s", torrent.title)
+        log.debug("Magnet URL: %s", torrent.download_url)
         torrent_hash = torf.Magnet.from_string(torrent.download_url).infohash
     else:
         # downloading the torrent file
-        log.info(f"Downloading .torrent file of torrent: {torrent.title}")
+        log.info("Downloading .torrent file of torrent: %s", torrent.title)
         try:
-            response = requests.get(str(torrent.download_url), timeout=30)
+            response = torrent_file_session.get(str(torrent.download_url), timeout=30)
             response.raise_for_status()
             torrent_content = response.content
         except InvalidSchema:
-            log.debug(f"Invalid schema for URL {torrent.download_url}", exc_info=True)
+            log.debug("Invalid schema for URL %s", torrent.download_url, exc_info=True)
             final_url = follow_redirects_to_final_torrent_url(
                 initial_url=torrent.download_url,
-                session=requests.Session(),
-                timeout=MediaManagerConfig().indexers.prowlarr.timeout_seconds,
+                session=torrent_file_session,
+                timeout=get_config().indexers.prowlarr.timeout_seconds,
             )
-            return torf.Magnet.from_string(final_url).infohash
+            return torf.Magnet.from_string(final_url).infohash, None
         except Exception:
             log.exception("Failed to download torrent file")
             raise
@@ -166,17 +330,74 @@ def get_torrent_hash(torrent: IndexerQueryResult) -> str:
         torrent_filepath.write_bytes(torrent_content)
 
         # parsing info hash
-        log.debug(f"parsing torrent file: {torrent.download_url}")
+        log.debug("parsing torrent file: %s", torrent.download_url)
         try:
-            decoded_content = bencoder.decode(torrent_content)
-            torrent_hash = hashlib.sha1(  # noqa: S324
-                bencoder.encode(decoded_content[b"info"])
+            info_start, info_end = get_info_dict_span(torrent_content)
+            # the info hash is an identifier, not a security primitive
+            torrent_hash = hashlib.sha1(
+                memoryview(torrent_content)[info_start:info_end],
+                usedforsecurity=False,
             ).hexdigest()
         except Exception:
             log.exception("Failed to decode torrent file")
             raise
 
-    return torrent_hash
+    return torrent_hash, torrent_content
+
+
+def get_info_dict_span(torrent_content: bytes) -> tuple[int, int]:
+    """
+    Locates the bencoded info dict in the content of a .torrent file.
+
+    The info hash is the SHA-1 of exactly these bytes, so they can be hashed in
+    place instead of decoding the whole file and encoding the info dict again.
+
+    :param torrent_content: The content of the .torrent file.
+    :return: The start and end offset of the value of the top-level info key.
+    :raises ValueError: If the content is not a bencoded dict with an info key.
+    """
+    if torrent_content[:1] != b"d":
+        msg = "Torrent file is not a bencoded dict"
+        raise ValueError(msg)
+    index = 1
+    while torrent_content[index : index + 1] != b"e":
+        key_start = index
+        index = _skip_bencoded_value(torrent_content, index)
+        value_end = _skip_bencoded_value(torrent_content, index)
+        if torrent_content[key_start:index] == b"4:info":
+            return index, value_end
+        index = value_end
+    msg = "Torrent file has no info dict"
+    raise ValueError(msg)
+
+
+def _skip_bencoded_value(content: bytes, index: int) -> int:
+    # returns the offset right after the bencoded value starting at index
+    depth = 0
+    while True:
+        token = content[index : index + 1]
+        if token in {b"d", b"l"}:
+            depth += 1
+            index += 1
+        elif token == b"e":
+            depth -= 1
+            index += 1
+            if depth < 0:
+                msg = "Unexpected end of bencoded value"
+                raise ValueError(msg)
+        elif token == b"i":
+            index = content.index(b"e", index) + 1
+        elif token.isdigit():
+            colon = content.index(b":", index)
+            index = colon + 1 + int(content[index:colon])
+            if index > len(content):
+                msg = "Bencoded string exceeds the torrent file"
+                raise ValueError(msg)
+        else:
+            msg = f"Invalid bencoded value at offset {index}"
+            raise ValueError(msg)
+        if depth == 0:
+            return index
 
 
 def remove_special_characters(filename: str) -> str:
@@ -187,7 +408,7 @@ def remove_special_characters(filename: str) -> str:
     :return: A sanitized version of the filename.
     """
     # Remove invalid characters
-    sanitized = re.sub(r"([<>:\"/\\|?*])", "", filename)
+    sanitized = filename.translate(SPECIAL_CHARACTERS_TABLE)
 
     # Remove leading and trailing dots or spaces
     return sanitized.strip(" .")
@@ -200,39 +421,57 @@ def remove_special_chars_and_parentheses(title: str) -> str:
     :param title: The original title.
     :return: A sanitized version of the title.
     """
+    sanitized = title
 
-    # Remove content within brackets
-    sanitized = re.sub(r"\[.*?\]", "", title)
+    # most titles have no brackets at all, they can skip the bracket passes
+    if not OPENING_BRACKETS.isdisjoint(sanitized):
+        # Remove content within brackets
+        sanitized = SQUARE_BRACKETS_PATTERN.sub("", sanitized)
 
-    # Remove content within curly brackets
-    sanitized = re.sub(r"\{.*?\}", "", sanitized)
+        # Remove content within curly brackets
+        sanitized = CURLY_BRACKETS_PATTERN.sub("", sanitized)
 
-    # Remove year within parentheses
-    sanitized = re.sub(r"\(\d{4}\)", "", sanitized)
+        # Remove year within parentheses
+        sanitized = YEAR_IN_PARENTHESES_PATTERN.sub("", sanitized)
 
     # Remove special characters
     sanitized = remove_special_characters(sanitized)
 
     # Collapse multiple whitespace characters and trim the result
-    return re.sub(r"\s+", " ", sanitized).strip()
+    return WHITESPACE_PATTERN.sub(" ", sanitized).strip()
 
 
-def get_importable_media_directories(path: Path) -> list[Path]:
+@cache
+def get_library_paths() -> frozenset[str]:
+    """
+    Returns the absolute paths of all configured movie and tv libraries.
+    The config doesn't change at runtime, so they are only resolved once.
+
+    :return: The library paths as plain strings.
+    """
     libraries = [
-        *MediaManagerConfig().misc.movie_libraries,
-        *MediaManagerConfig().misc.tv_libraries,
+        *get_config().misc.movie_libraries,
+        *get_config().misc.tv_libraries,
     ]
+    return frozenset(str(Path(library.path).absolute()) for library in libraries)
 
-    library_paths = {Path(library.path).absolute() for library in libraries}
 
-    unfiltered_dirs = [d for d in path.glob("*") if d.is_dir()]
+def get_importable_media_directories(path: Path) -> list[Path]:
+    # compare plain strings, so no Path object is built for rejected entries
+    library_paths = get_library_paths()
+    base_path = str(path.absolute())
 
-    return [
-        media_dir
-        for media_dir in unfiltered_dirs
-        if media_dir.absolute() not in library_paths
-        and not media_dir.name.startswith(".")
-    ]
+    if not path.is_dir():
+        return []
+
+    with os.scandir(path) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if not entry.name.startswith(".")
+            and entry.is_dir()
+            and os.path.join(base_path, entry.name) not in library_paths  # noqa: PTH118
+        ]
 
 
 def extract_external_id_from_string(input_string: str) -> tuple[str | None, int | None]:
@@ -242,9 +481,7 @@ def extract_external_id_from_string(input_string: str) -> tuple[str | None, int
     :param input_string: The string to extract the ID from.
     :return: The extracted Metadata Provider and ID or None if not found.
     """
-    match = re.search(
-        r"\b(tmdb|tvdb)(?:id)?[-_]?([0-9]+)\b", input_string, re.IGNORECASE
-    )
+    match = EXTERNAL_ID_PATTERN.search(input_string)
     if match:
         return match.group(1).lower(), int(match.group(2))
 
@@ -73,7 +73,7 @@ class EpisodeFile(Base):
         ForeignKey(column="episode.id", ondelete="CASCADE"),
     )
     torrent_id: Mapped[UUID | None] = mapped_column(
-        ForeignKey(column="torrent.id", ondelete="SET NULL"),
+        ForeignKey(column="torrent.id", ondelete="SET NULL"), index=True
     )
     file_path_suffix: Mapped[str]
     quality: Mapped[Quality]
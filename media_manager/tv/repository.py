@@ -1,6 +1,6 @@
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from media_manager.exceptions import ConflictError, NotFoundError
 from media_manager.torrent.models import Torrent
@@ -43,9 +43,9 @@ class TvRepository:
             stmt = (
                 select(Show)
                 .where(Show.id == show_id)
-                .options(joinedload(Show.seasons).joinedload(Season.episodes))
+                .options(selectinload(Show.seasons).selectinload(Season.episodes))
             )
-            result = self.db.execute(stmt).unique().scalar_one_or_none()
+            result = self.db.execute(stmt).scalar_one_or_none()
             if not result:
                 msg = f"Show with id {show_id} not found."
                 raise NotFoundError(msg)
@@ -71,9 +71,9 @@ class TvRepository:
                 select(Show)
                 .where(Show.external_id == external_id)
                 .where(Show.metadata_provider == metadata_provider)
-                .options(joinedload(Show.seasons).joinedload(Season.episodes))
+                .options(selectinload(Show.seasons).selectinload(Season.episodes))
             )
-            result = self.db.execute(stmt).unique().scalar_one_or_none()
+            result = self.db.execute(stmt).scalar_one_or_none()
             if not result:
                 msg = f"Show with external_id {external_id} and provider {metadata_provider} not found."
                 raise NotFoundError(msg)
@@ -93,9 +93,9 @@ class TvRepository:
         """
         try:
             stmt = select(Show).options(
-                joinedload(Show.seasons).joinedload(Season.episodes)
+                selectinload(Show.seasons).selectinload(Season.episodes)
             )
-            results = self.db.execute(stmt).scalars().unique().all()
+            results = self.db.execute(stmt).scalars().all()
             return [ShowSchema.model_validate(show) for show in results]
         except SQLAlchemyError:
             log.exception("Database error while retrieving all shows")
@@ -120,54 +120,64 @@ class TvRepository:
         """
         db_show = self.db.get(Show, show.id) if show.id else None
 
-        if db_show:  # Update existing show
-            db_show.external_id = show.external_id
-            db_show.metadata_provider = show.metadata_provider
-            db_show.name = show.name
-            db_show.overview = show.overview
-            db_show.year = show.year
-            db_show.original_language = show.original_language
-            db_show.imdb_id = show.imdb_id
-        else:  # Insert new show
-            db_show = Show(
-                id=show.id,
-                external_id=show.external_id,
-                metadata_provider=show.metadata_provider,
-                name=show.name,
-                overview=show.overview,
-                year=show.year,
-                ended=show.ended,
-                original_language=show.original_language,
-                imdb_id=show.imdb_id,
-                seasons=[
-                    Season(
-                        id=season.id,
-                        show_id=show.id,
-                        number=season.number,
-                        external_id=season.external_id,
-                        name=season.name,
-                        overview=season.overview,
-                        episodes=[
-                            Episode(
-                                id=episode.id,
-                                season_id=season.id,
-                                number=episode.number,
-                                external_id=episode.external_id,
-                                title=episode.title,
-                                overview=episode.overview,
-                            )
-                            for episode in season.episodes
-                        ],
-                    )
-                    for season in show.seasons
-                ],
-            )
-            self.db.add(db_show)
-
         try:
+            if db_show:  # Update existing show
+                db_show.external_id = show.external_id
+                db_show.metadata_provider = show.metadata_provider
+                db_show.name = show.name
+                db_show.overview = show.overview
+                db_show.year = show.year
+                db_show.original_language = show.original_language
+                db_show.imdb_id = show.imdb_id
+                saved_show = ShowSchema.model_validate(db_show)
+                self.db.commit()
+                return saved_show
+
+            # Insert new show, one statement per table instead of one per row
+            stored_defaults = self.db.execute(
+                insert(Show)
+                .values(
+                    id=show.id,
+                    external_id=show.external_id,
+                    metadata_provider=show.metadata_provider,
+                    name=show.name,
+                    overview=show.overview,
+                    year=show.year,
+                    ended=show.ended,
+                    original_language=show.original_language,
+                    imdb_id=show.imdb_id,
+                )
+                .returning(Show.continuous_download, Show.library)
+            ).one()
+            season_rows = [
+                {
+                    "id": season.id,
+                    "show_id": show.id,
+                    "number": season.number,
+                    "external_id": season.external_id,
+                    "name": season.name,
+                    "overview": season.overview,
+                }
+                for season in show.seasons
+            ]
+            episode_rows = [
+                {
+                    "id": episode.id,
+                    "season_id": season.id,
+                    "number": episode.number,
+                    "external_id": episode.external_id,
+                    "title": episode.title,
+                    "overview": episode.overview,
+                }
+                for season in show.seasons
+                for episode in season.episodes
+            ]
+            if season_rows:
+                self.db.execute(insert(Season), season_rows)
+            if episode_rows:
+                self.db.execute(insert(Episode), episode_rows)
             self.db.commit()
-            self.db.refresh(db_show)
-            return ShowSchema.model_validate(db_show)
+            return show.model_copy(update=stored_defaults._asdict())
         except IntegrityError as e:
             self.db.rollback()
             msg = f"Show with this primary key or unique constraint violation: {e.orig}"
@@ -268,9 +278,9 @@ class TvRepository:
                 select(Season)
                 .where(Season.show_id == show_id)
                 .where(Season.number == season_number)
-                .options(joinedload(Season.episodes), joinedload(Season.show))
+                .options(selectinload(Season.episodes), joinedload(Season.show))
             )
-            result = self.db.execute(stmt).unique().scalar_one_or_none()
+            result = self.db.execute(stmt).scalar_one_or_none()
             if not result:
                 msg = f"Season number {season_number} for show_id {show_id} not found."
                 raise NotFoundError(msg)
@@ -294,8 +304,6 @@ class TvRepository:
         try:
             self.db.add(db_model)
             self.db.commit()
-            self.db.refresh(db_model)
-            return EpisodeFileSchema.model_validate(db_model)
         except IntegrityError as e:
             self.db.rollback()
             log.error(f"Integrity error while adding episode file: {e}")
@@ -304,6 +312,8 @@ class TvRepository:
             self.db.rollback()
             log.error(f"Database error while adding episode file: {e}")
             raise
+        else:
+            return episode_file
 
     def remove_episode_files_by_torrent_id(self, torrent_id: TorrentId) -> int:
         """
@@ -426,10 +436,10 @@ class TvRepository:
                 .join(Episode, Season.id == Episode.season_id)
                 .join(EpisodeFile, Episode.id == EpisodeFile.episode_id)
                 .join(Torrent, EpisodeFile.torrent_id == Torrent.id)
-                .options(joinedload(Show.seasons).joinedload(Season.episodes))
+                .options(selectinload(Show.seasons).selectinload(Season.episodes))
                 .order_by(Show.name)
             )
-            results = self.db.execute(stmt).scalars().unique().all()
+            results = self.db.execute(stmt).scalars().all()
             return [ShowSchema.model_validate(show) for show in results]
         except SQLAlchemyError:
             log.exception("Database error retrieving all shows with torrents")
@@ -499,9 +509,9 @@ class TvRepository:
                 select(Show)
                 .join(Season, Show.id == Season.show_id)
                 .where(Season.id == season_id)
-                .options(joinedload(Show.seasons).joinedload(Season.episodes))
+                .options(selectinload(Show.seasons).selectinload(Season.episodes))
             )
-            result = self.db.execute(stmt).unique().scalar_one_or_none()
+            result = self.db.execute(stmt).scalar_one_or_none()
             if not result:
                 msg = f"Show for season_id {season_id} not found."
                 raise NotFoundError(msg)
@@ -556,9 +566,10 @@ class TvRepository:
         )
 
         self.db.add(db_season)
+        self.db.flush()
+        saved_season = SeasonSchema.model_validate(db_season)
         self.db.commit()
-        self.db.refresh(db_season)
-        return SeasonSchema.model_validate(db_season)
+        return saved_season
 
     def add_episode_to_season(
         self, season_id: SeasonId, episode_data: EpisodeSchema
@@ -596,9 +607,10 @@ class TvRepository:
         )
 
         self.db.add(db_episode)
+        self.db.flush()
+        saved_episode = EpisodeSchema.model_validate(db_episode)
         self.db.commit()
-        self.db.refresh(db_episode)
-        return EpisodeSchema.model_validate(db_episode)
+        return saved_episode
 
     def update_show_attributes(
         self,
@@ -649,10 +661,10 @@ class TvRepository:
         if imdb_id is not None and db_show.imdb_id != imdb_id:
             db_show.imdb_id = imdb_id
             updated = True
+        updated_show = ShowSchema.model_validate(db_show)
         if updated:
             self.db.commit()
-            self.db.refresh(db_show)
-        return ShowSchema.model_validate(db_show)
+        return updated_show
 
     def update_season_attributes(
         self, season_id: SeasonId, name: str | None = None, overview: str | None = None
@@ -681,13 +693,13 @@ class TvRepository:
             db_season.overview = overview
             updated = True
 
+        updated_season = SeasonSchema.model_validate(db_season)
         if updated:
-            self.db.commit()
-            self.db.refresh(db_season)
             log.debug(
                 f"Updating existing season {db_season.number} for show {db_season.show.name}"
             )
-        return SeasonSchema.model_validate(db_season)
+            self.db.commit()
+        return updated_season
 
     def update_episode_attributes(
         self,
@@ -719,8 +731,8 @@ class TvRepository:
             db_episode.overview = overview
             updated = True
 
+        updated_episode = EpisodeSchema.model_validate(db_episode)
         if updated:
-            self.db.commit()
-            self.db.refresh(db_episode)
             log.info(f"Updating existing episode {db_episode.number}")
-        return EpisodeSchema.model_validate(db_episode)
+            self.db.commit()
+        return updated_episode
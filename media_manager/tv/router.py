@@ -3,7 +3,7 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from media_manager.auth.users import current_active_user, current_superuser
-from media_manager.config import LibraryItem, MediaManagerConfig
+from media_manager.config import LibraryItem, get_config
 from media_manager.exceptions import MediaAlreadyExistsError, NotFoundError
 from media_manager.indexer.schemas import (
     IndexerQueryResult,
@@ -93,7 +93,7 @@ def import_detected_show(
     """
     source_directory = Path(directory)
     if source_directory not in get_importable_media_directories(
-        MediaManagerConfig().misc.tv_directory
+        get_config().misc.tv_directory
     ):
         raise HTTPException(status.HTTP_400_BAD_REQUEST, "No such directory")
     tv_service.import_existing_tv_show(
@@ -171,7 +171,7 @@ def get_available_libraries() -> list[LibraryItem]:
     """
     Get available TV libraries from configuration.
     """
-    return MediaManagerConfig().misc.tv_libraries
+    return get_config().misc.tv_libraries
 
 
 # -----------------------------------------------------------------------------
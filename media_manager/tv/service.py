@@ -6,7 +6,7 @@ from typing import overload
 
 from sqlalchemy.exc import IntegrityError
 
-from media_manager.config import MediaManagerConfig
+from media_manager.config import get_config
 from media_manager.exceptions import InvalidConfigError, NotFoundError, RenameError
 from media_manager.indexer.schemas import IndexerQueryResult, IndexerQueryResultId
 from media_manager.indexer.service import IndexerService
@@ -576,7 +576,7 @@ class TvService:
         return show_torrent
 
     def get_root_show_directory(self, show: Show) -> Path:
-        misc_config = MediaManagerConfig().misc
+        misc_config = get_config().misc
         show_directory_name = f"{remove_special_characters(show.name)} ({show.year}) [{show.metadata_provider}id-{show.external_id}]"
         log.debug(
             f"Show {show.name} without special characters: {remove_special_characters(show.name)}"
@@ -1033,7 +1033,7 @@ class TvService:
     def get_importable_tv_shows(
         self, metadata_provider: AbstractMetadataProvider
     ) -> list[MediaImportSuggestion]:
-        tv_directory = MediaManagerConfig().misc.tv_directory
+        tv_directory = get_config().misc.tv_directory
         import_suggestions: list[MediaImportSuggestion] = []
         candidate_dirs = get_importable_media_directories(tv_directory)
 
@@ -1064,23 +1064,22 @@ class TvService:
 
     def import_all_torrents(self) -> None:
         log.info("Importing all torrents")
-        torrents = self.torrent_service.get_all_torrents()
+        torrents = self.torrent_service.get_unimported_torrents()
         log.info("Found %d torrents to import", len(torrents))
-        for t in torrents:
-            show = None
+        finished_torrents = [
+            t for t in torrents if not t.imported and t.status == TorrentStatus.finished
+        ]
+        shows = self.torrent_service.get_shows_of_torrents(torrents=finished_torrents)
+        for t in finished_torrents:
+            show = shows.get(t.id)
+            if show is None:
+                log.warning(f"torrent {t.title} is not a tv torrent, skipping import.")
+                continue
             try:
-                if not t.imported and t.status == TorrentStatus.finished:
-                    show = self.torrent_service.get_show_of_torrent(torrent=t)
-                    if show is None:
-                        log.warning(
-                            f"torrent {t.title} is not a tv torrent, skipping import."
-                        )
-                        continue
-                    self.import_episode_files_from_torrent(torrent=t, show=show)
+                self.import_episode_files_from_torrent(torrent=t, show=show)
             except RuntimeError as e:
-                show_name = show.name if show is not None else "<unknown>"
                 log.error(
-                    f"Error importing torrent {t.title} for show {show_name}: {e}",
+                    f"Error importing torrent {t.title} for show {show.name}: {e}",
                     exc_info=True,
                 )
         log.info("Finished importing all torrents")